@@ -1,41 +1,46 @@
-from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Request, BackgroundTasks
-from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
+from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Request, Response
+from fastapi.responses import FileResponse, ORJSONResponse, StreamingResponse
 from pathlib import Path
-from typing import Optional, Dict
-import json
+from typing import Iterable, Optional
+from concurrent.futures import Executor
 import asyncio
-import queue
+import orjson
 from app.services.file_handler import FileHandler
 from app.services.converter import ExcelConverter
 from app.services.translator import TranslationService
 from app.models.schemas import TranslationResponse
-from app.core.exceptions import TranslationError
+from app.core.exceptions import InvalidFileFormatError
 from app.core.config import settings
 from app.core.prompts import get_available_languages
-from app.utils.log_handler import create_session, get_log_queue, cleanup_session, add_session_handler, remove_session_handler
+from app.utils.log_handler import create_session, subscribe, unsubscribe, add_session_handler
 from app.utils.progress_tracker import get_progress_tracker, cleanup_progress_tracker, TranslationStage
+from app.utils.validators import validate_file_extension, validate_file_size
 import logging
-import uuid
-import asyncio
-import json
-import queue
+import threading
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
-# Global progress tracking
-progress_store: Dict[str, dict] = {}
+# Settings are frozen, so hot-path values can be bound once
+_DEFAULT_API_KEY = settings.OPENAI_API_KEY
+
+# Language list is static, so serialize it once at import
+_LANGUAGES_JSON = orjson.dumps(get_available_languages())
 
 
 @router.get("/languages")
 async def get_languages():
     """Get available languages for translation"""
-    return JSONResponse(content=get_available_languages())
+    return Response(
+        content=_LANGUAGES_JSON,
+        media_type="application/json",
+        headers={"Cache-Control": "public, max-age=86400"}
+    )
 
 
-@router.post("/translate", response_model=TranslationResponse)
+@router.post("/translate", responses={200: {"model": TranslationResponse}})
 async def translate_file(
-    background_tasks: BackgroundTasks,
+    request: Request,
     file: UploadFile = File(...),
     api_key: Optional[str] = Form(None),
     source_lang: str = Form(default="ko"),
@@ -47,54 +52,112 @@ async def translate_file(
     Lightning fast entry point: Just queue the task and return
     """
     # Quick check for API key
-    final_api_key = api_key if api_key else settings.OPENAI_API_KEY
+    final_api_key = api_key if api_key else _DEFAULT_API_KEY
     if not final_api_key:
         raise HTTPException(status_code=400, detail="API key is required.")
 
-    # Read file content into memory immediately to keep it available for background task
-    file_content = await file.read()
-    filename = file.filename
+    filename = file.filename or ""
     
-    # Offload EVERYTHING else to background
-    background_tasks.add_task(
-        run_translation_task_full,
-        file_content=file_content,
-        filename=filename,
-        api_key=final_api_key,
-        source_lang=source_lang,
-        target_lang=target_lang,
-        model=model,
-        session_id=session_id
-    )
+    # Reject oversized or unsupported uploads before copying anything
+    try:
+        content_length = int(request.headers.get("content-length", 0))
+    except ValueError:
+        content_length = 0
     
-    return TranslationResponse(
-        success=True,
-        message="Job queued successfully",
-        download_url="",
-        filename=filename,
-        sheets_processed=0
-    )
+    try:
+        validate_file_size(content_length)
+    except InvalidFileFormatError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    
+    try:
+        validate_file_extension(filename)
+    except InvalidFileFormatError as e:
+        raise HTTPException(status_code=415, detail=str(e))
+    
+    # Stream upload to disk in 1MB chunks, aborting once it exceeds the size limit
+    try:
+        input_path = await FileHandler().save_upload_file(file)
+    except InvalidFileFormatError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    
+    # Offload EVERYTHING else to the translation worker pool
+    job_queue: asyncio.Queue = request.app.state.job_queue
+    await job_queue.put({
+        "input_path": input_path,
+        "filename": filename,
+        "api_key": final_api_key,
+        "source_lang": source_lang,
+        "target_lang": target_lang,
+        "model": model,
+        "session_id": session_id
+    })
+    logger.info(f"Job queued: {filename} ({job_queue.qsize()} waiting)")
+    
+    # Static-shape payload: skip pydantic validation, schema kept for OpenAPI
+    return ORJSONResponse({
+        "success": True,
+        "message": "Job queued successfully",
+        "download_url": "",
+        "filename": filename,
+        "sheets_processed": 0
+    })
+
+
+async def translation_worker(job_queue: asyncio.Queue, process_pool: Optional[Executor] = None):
+    """
+    Consume translation jobs from the queue one at a time
+    
+    A fixed number of these workers is started on app startup, which caps
+    how many translations (and OpenAI workflows) run concurrently.
+    """
+    while True:
+        job = await job_queue.get()
+        try:
+            await run_translation_task_full(**job, process_pool=process_pool)
+        except Exception as e:
+            logger.error(f"Translation worker failed: {str(e)}")
+        finally:
+            job_queue.task_done()
+
+
+async def temp_file_janitor():
+    """
+    Periodically purge stale files from the temp directory
+    
+    Translated outputs are never deleted after download, so without this
+    the temp directory grows without bound.
+    """
+    file_handler = FileHandler()
+    while True:
+        await asyncio.sleep(settings.TEMP_SWEEP_INTERVAL_SECONDS)
+        try:
+            removed = await asyncio.to_thread(
+                file_handler.cleanup_stale_files,
+                settings.TEMP_FILE_TTL_SECONDS
+            )
+            if removed:
+                logger.info(f"Temp janitor removed {removed} stale file(s)")
+        except Exception as e:
+            logger.error(f"Temp janitor failed: {str(e)}")
 
 
 async def run_translation_task_full(
-    file_content: bytes,
+    input_path: Path,
     filename: str,
     api_key: str,
     source_lang: str,
     target_lang: str,
     model: str,
-    session_id: Optional[str]
+    session_id: Optional[str],
+    process_pool: Optional[Executor] = None
 ):
     """
     Heavy lifting background worker with non-blocking execution
-    """
-    import os
-    import uuid
-    import asyncio
-    from app.services.file_handler import FileHandler
     
+    Excel generation is CPU-bound openpyxl work, so it runs in process_pool
+    when given (falling back to a thread) to keep the GIL off the event loop.
+    """
     file_handler = FileHandler()
-    input_path = None
     log_handler = None
     progress_tracker = None
     
@@ -106,17 +169,7 @@ async def run_translation_task_full(
         if progress_tracker:
             progress_tracker.set_stage(TranslationStage.UPLOAD, "파일 저장 및 분석 중")
         
-        # 1. Save file from memory bytes (Blocking I/O in thread)
-        file_ext = Path(filename).suffix
-        unique_filename = f"{uuid.uuid4()}{file_ext}"
-        input_path = Path("temp") / unique_filename
-        input_path.parent.mkdir(exist_ok=True)
-        
-        def save_file_sync():
-            with open(input_path, "wb") as f:
-                f.write(file_content)
-        
-        await asyncio.to_thread(save_file_sync)
+        # 1. File was already streamed to disk by the request handler
         logger.info(f"Background task: File saved to {input_path}")
         
         # Yield to event loop to let logs flush
@@ -125,18 +178,22 @@ async def run_translation_task_full(
         # Determine file type
         file_ext = input_path.suffix.lower()
         
-        # Convert to CSV dict (Blocking CPU/IO in thread)
+        # Convert to CSV chunks per sheet (Blocking CPU/IO in thread)
+        # The row count is taken up front so progress has a fixed total
         def convert_to_csv_sync():
             if file_ext == '.xlsx':
-                return ExcelConverter.excel_to_csv_dict(input_path)
+                csv_dict = ExcelConverter.excel_to_csv_dict(input_path)
+                total_rows = sum(ExcelConverter.count_csv_string_rows(content) for content in csv_dict.values())
+                return {sheet_name: [content] for sheet_name, content in csv_dict.items()}, total_rows
             else:
-                content = ExcelConverter.csv_file_to_string(input_path)
-                return {"Sheet1": content}
+                # Stream large CSVs in row-bounded chunks instead of loading them whole
+                total_rows = ExcelConverter.count_csv_rows(input_path)
+                return {"Sheet1": ExcelConverter.iter_csv_chunks(input_path)}, total_rows
         
-        csv_dict = await asyncio.to_thread(convert_to_csv_sync)
+        sheet_chunks, total_rows = await asyncio.to_thread(convert_to_csv_sync)
             
-        total_sheets = len(csv_dict)
-        logger.info(f"Sheets to translate: {list(csv_dict.keys())} (Total: {total_sheets})")
+        total_sheets = len(sheet_chunks)
+        logger.info(f"Sheets to translate: {list(sheet_chunks.keys())} (Total: {total_sheets})")
         logger.info(f"Translation: {source_lang} -> {target_lang}")
         
         if progress_tracker:
@@ -146,19 +203,21 @@ async def run_translation_task_full(
         await asyncio.sleep(0.01)
         
         # Define progress callback for translator
-        # Since this runs in a thread, we need to be careful with async calls.
-        # However, the tracker's methods are simple sync updaters, which IS OK.
-        # But logging inside tracker might block slightly. Usually negligible.
+        # It is called from the event loop as rows finish; the tracker's
+        # methods are simple sync updaters, so no await is needed.
+        # Sheets are translated concurrently, so translated rows are summed
+        # across sheets under a lock and reported against the fixed total.
+        row_counts = {"completed": 0}
+        row_lock = threading.Lock()
+        
         def translation_progress_callback(event_type: str, *args):
             if not progress_tracker:
                 return
             
-            if event_type == 'chunks_total':
-                total_chunks = args[0]
-                progress_tracker.set_translation_chunks(total_chunks)
-            elif event_type == 'chunk_complete':
-                current, total = args[0], args[1]
-                progress_tracker.increment_chunk(current, total)
+            with row_lock:
+                if event_type == 'rows_complete':
+                    row_counts["completed"] = min(row_counts["completed"] + args[0], total_rows)
+                    progress_tracker.increment_chunk(row_counts["completed"], total_rows)
         
         # Translate with progress tracking
         translator = TranslationService(
@@ -170,28 +229,35 @@ async def run_translation_task_full(
         if progress_tracker:
             progress_tracker.complete_stage(TranslationStage.PREPARATION, "번역 준비 완료")
             progress_tracker.set_stage(TranslationStage.TRANSLATION, "AI 번역 시작")
+            progress_tracker.set_translation_chunks(total_rows)
             
         await asyncio.sleep(0.01)
         
         # Stage 3: Translation (20-80%)
-        translated_dict = {}
+        # Sheets are independent, so translate them concurrently (bounded)
+        semaphore = asyncio.Semaphore(settings.TRANSLATE_CONCURRENCY)
         
-        for idx, (sheet_name, csv_content) in enumerate(csv_dict.items(), 1):
-            logger.info(f"Translating sheet {idx}/{total_sheets}: {sheet_name}")
-            
-            # Run translation in thread to unblock SSE stream!
-            translated_content = await asyncio.to_thread(
-                translator.translate_csv,
-                csv_content,
-                source_lang,
-                target_lang,
-                sheet_name
-            )
-            
-            translated_dict[sheet_name] = translated_content
-            logger.info(f"Completed sheet {idx}/{total_sheets}: {sheet_name}")
-            # Yield control again
-            await asyncio.sleep(0.01)
+        async def translate_sheet(idx: int, sheet_name: str, csv_chunks: Iterable[str]):
+            async with semaphore:
+                logger.info(f"Translating sheet {idx}/{total_sheets}: {sheet_name}")
+                
+                # GPT requests run on the event loop via the async client;
+                # chunk parsing is handed off to threads inside the translator
+                translated_content = await translator.translate_csv_chunks_async(
+                    csv_chunks,
+                    source_lang,
+                    target_lang,
+                    sheet_name
+                )
+                
+                logger.info(f"Completed sheet {idx}/{total_sheets}: {sheet_name}")
+                return sheet_name, translated_content
+        
+        results = await asyncio.gather(*(
+            translate_sheet(idx, sheet_name, csv_chunks)
+            for idx, (sheet_name, csv_chunks) in enumerate(sheet_chunks.items(), 1)
+        ))
+        translated_dict = dict(results)
         
         logger.info("All translations completed")
         
@@ -207,10 +273,11 @@ async def run_translation_task_full(
         output_filename = f"{original_stem}_translated.xlsx"
         output_path = Path("temp") / output_filename
         
-        # Run Excel generation in thread
-        await asyncio.to_thread(
+        # Run Excel generation in a worker process (or thread if no pool)
+        await asyncio.get_running_loop().run_in_executor(
+            process_pool,
             ExcelConverter.csv_to_excel,
-            translated_dict, 
+            translated_dict,
             output_path
         )
         
@@ -239,9 +306,9 @@ async def run_translation_task_full(
         if session_id:
             cleanup_progress_tracker(session_id)
         
-        # Cleanup input file
+        # Cleanup input file (in thread to keep the event loop free)
         if input_path:
-            file_handler.cleanup_file(input_path)
+            await asyncio.to_thread(file_handler.cleanup_file, input_path)
 
 
 @router.get("/download/{filename}")
@@ -260,11 +327,17 @@ async def download_file(filename: str):
     if not file_path.exists():
         raise HTTPException(status_code=404, detail="File not found")
     
-    return FileResponse(
+    # Passing stat_result sets Content-Length up front so proxies don't buffer
+    response = FileResponse(
         path=file_path,
         filename=filename,
-        media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+        media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        stat_result=file_path.stat(),
+        headers={"X-Accel-Buffering": "no"}
     )
+    # Read in 1MB chunks instead of the 64KB default
+    response.chunk_size = 1 << 20
+    return response
 
 
 @router.get("/logs/stream")
@@ -280,11 +353,11 @@ async def stream_logs(request: Request, session_id: str):
         StreamingResponse with SSE data
     """
     async def event_generator():
-        """Generate SSE events from log queue"""
-        log_queue = get_log_queue(session_id)
+        """Generate SSE events from the session's payload buffer"""
+        subscriber = subscribe(session_id)
         
-        if not log_queue:
-            yield f"data: {json.dumps({'error': 'Invalid session ID'})}\n\n"
+        if subscriber is None:
+            yield b"data: " + orjson.dumps({'error': 'Invalid session ID'}) + b"\n\n"
             return
         
         try:
@@ -293,29 +366,18 @@ async def stream_logs(request: Request, session_id: str):
                 if await request.is_disconnected():
                     break
                 
-                try:
-                    # Get log from queue with timeout
-                    log_entry = log_queue.get(timeout=1)
-                    
-                    # Format as SSE
-                    data = json.dumps({
-                        'level': log_entry['level'],
-                        'message': log_entry['message'],
-                        'timestamp': log_entry['timestamp']
-                    })
-                    
-                    yield f"data: {data}\n\n"
-                    
-                except queue.Empty:
-                    # Send keepalive
-                    yield f": keepalive\n\n"
-                    await asyncio.sleep(1)
+                # Payloads are already SSE-encoded by the log handler;
+                # everything buffered since the last write goes out at once
+                batch = await subscriber.drain(timeout=1.0)
+                
+                # Send keepalive when nothing arrived
+                yield batch or b": keepalive\n\n"
                     
         except asyncio.CancelledError:
             pass
         finally:
-            # Cleanup when client disconnects
-            cleanup_session(session_id)
+            # Detach this client; session is cleaned up after the last one leaves
+            unsubscribe(session_id, subscriber)
     
     return StreamingResponse(
         event_generator(),
@@ -337,7 +399,7 @@ async def create_log_session():
         JSON with session ID
     """
     session_id = create_session()
-    return JSONResponse(content={"session_id": session_id})
+    return ORJSONResponse(content={"session_id": session_id})
 
 
 # Made with Bob
@@ -1,9 +1,13 @@
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 
 class Settings(BaseSettings):
+    # Read-only after load, so values can safely be hoisted into module globals
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=True, frozen=True)
+    
     # Application
     APP_NAME: str = "Excel Translator"
     VERSION: str = "1.0.0"
@@ -16,11 +20,20 @@ class Settings(BaseSettings):
     MAX_FILE_SIZE: int = 50 * 1024 * 1024  # 50MB
     ALLOWED_EXTENSIONS: set = {".xlsx", ".csv"}
     TEMP_DIR: Path = Path("temp")
+    TEMP_FILE_TTL_SECONDS: int = 3600  # Delete temp files older than this
+    TEMP_SWEEP_INTERVAL_SECONDS: int = 600
+    
+    # Log streaming
+    LOG_QUEUE_MAXSIZE: int = 1000  # Max pending SSE frames per client (oldest dropped)
     
     # GPT API
     GPT_MODEL: str = "gpt-4-turbo-preview"
     MAX_TOKENS: int = 4096
     TEMPERATURE: float = 0.3
+    TRANSLATE_CONCURRENCY: int = 4  # Max sheets translated at once
+    CHUNK_CONCURRENCY: int = 8  # Max GPT requests in flight per sheet
+    CHUNK_TOKEN_BUDGET: int = 8000  # Max prompt tokens of rows per GPT request
+    TRANSLATION_WORKERS: int = 2  # Max translation jobs running at once
     
     # Server
     HOST: str = "0.0.0.0"
@@ -28,12 +41,14 @@ class Settings(BaseSettings):
     
     # CORS
     CORS_ORIGINS: list = ["*"]
-    
-    class Config:
-        env_file = ".env"
-        case_sensitive = True
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Load settings (and parse .env) once per process"""
+    return Settings()
+
+
+settings = get_settings()
 
 # Made with Bob
@@ -1,21 +1,28 @@
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
-from app.api.routes import router
+from fastapi.responses import FileResponse, ORJSONResponse
+from app.api.routes import router, translation_worker, temp_file_janitor
 from app.core.config import settings
+from app.services.translator import close_async_clients, preload_token_encoders
+from app.utils.log_handler import (
+    setup_queue_logging, start_log_listener, stop_log_listener,
+    start_worker_log_forwarding, stop_worker_log_forwarding, init_worker_logging
+)
+from concurrent.futures import ProcessPoolExecutor
+import asyncio
 import logging
+import multiprocessing
+import os
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Configure non-blocking, queue-based logging
+setup_queue_logging(logging.INFO)
 
 app = FastAPI(
     title=settings.APP_NAME,
     version=settings.VERSION,
-    debug=settings.DEBUG
+    debug=settings.DEBUG,
+    default_response_class=ORJSONResponse
 )
 
 # CORS
@@ -34,6 +41,45 @@ app.mount("/static", StaticFiles(directory="static"), name="static")
 app.include_router(router, prefix="/api", tags=["translation"])
 
 
+@app.on_event("startup")
+async def startup_event():
+    """Start background log listener, Excel process pool, translation workers, temp janitor and tokenizer preload"""
+    start_log_listener()
+    
+    # Spawn (not fork): the log listener and translation threads are already running.
+    # Spawned workers start without logging, so point them back at our log queue.
+    mp_context = multiprocessing.get_context("spawn")
+    worker_log_queue = start_worker_log_forwarding(mp_context)
+    app.state.process_pool = ProcessPoolExecutor(
+        max_workers=os.cpu_count(),
+        mp_context=mp_context,
+        initializer=init_worker_logging,
+        initargs=(worker_log_queue, logging.getLogger().level)
+    )
+    
+    app.state.job_queue = asyncio.Queue()
+    app.state.workers = [
+        asyncio.create_task(translation_worker(app.state.job_queue, app.state.process_pool))
+        for _ in range(settings.TRANSLATION_WORKERS)
+    ]
+    app.state.workers.append(asyncio.create_task(temp_file_janitor()))
+    # tiktoken downloads its BPE files on first use; fetch them in the background
+    app.state.workers.append(asyncio.create_task(asyncio.to_thread(preload_token_encoders)))
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop translation workers, process pool and OpenAI clients, then flush and stop background log listener"""
+    for worker in app.state.workers:
+        worker.cancel()
+    await asyncio.gather(*app.state.workers, return_exceptions=True)
+    app.state.process_pool.shutdown(wait=False, cancel_futures=True)
+    await close_async_clients()
+    
+    stop_worker_log_forwarding()
+    stop_log_listener()
+
+
 @app.get("/")
 async def root():
     """Serve main page"""
@@ -1,107 +1,48 @@
 import pandas as pd
+import csv
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Iterable, Iterator, List, Set
 from io import StringIO
+from datetime import datetime, time as dt_time
 from app.utils.encoding import detect_encoding
-from openpyxl import load_workbook
-from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
+from openpyxl import Workbook, load_workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, Alignment, PatternFill, Border, Side, NamedStyle
+from openpyxl.styles.fonts import DEFAULT_FONT
 from openpyxl.utils import get_column_letter
 from openpyxl.worksheet.table import Table, TableStyleInfo
 import logging
+import warnings
 
 logger = logging.getLogger(__name__)
 
+# Shared style objects, built once and reused for every sheet and cell
+# Colors use 8-digit ARGB; a 6-digit value gets alpha 00 (transparent)
+_HEADER_FILL = PatternFill("solid", fgColor="FF1F4E79")  # Dark blue
+_HEADER_FONT = Font(bold=True, color="FFFFFFFF")
+_HEADER_ALIGNMENT = Alignment(vertical="center", horizontal="center", wrap_text=True)
+_BODY_ALIGNMENT = Alignment(vertical="top", horizontal="left", wrap_text=True)
+_BODY_ALIGNMENT_NO_WRAP = Alignment(vertical="top", horizontal="left", wrap_text=False)
+_THIN_SIDE = Side(style="thin", color="FF9E9E9E")
+_BORDER_ALL = Border(left=_THIN_SIDE, right=_THIN_SIDE, top=_THIN_SIDE, bottom=_THIN_SIDE)
+
 
 class ExcelConverter:
     """Handle Excel and CSV file conversions"""
     
     @staticmethod
-    def apply_excel_styling(
-        ws,
-        header_row: int = 1,
-        freeze_panes_cell: str = "A2",
-        table_name: str = "DataTable",
-        table_style: str = "TableStyleMedium9",
-        min_row_height: float = 18,
-        header_row_height: float = 26,
-        wrap_text: bool = True,
-    ):
-        """
-        Apply professional Excel styling:
-        - Freeze header row
-        - Auto-filter with table style
-        - Auto-adjust column widths
-        - Text wrapping + top alignment
-        - Header emphasis
-        - Borders
-        - Minimum row height
-        """
-        # 1) Freeze panes
-        ws.freeze_panes = freeze_panes_cell
-
-        # 2) Determine used range
-        max_row = ws.max_row
-        max_col = ws.max_column
+    def _add_table(ws, table_ref: str, table_name: str, table_style: str, column_names: List[str]) -> None:
+        """
+        Add a styled Excel Table (AutoFilter + banded rows) over table_ref
         
-        if max_row < header_row or max_col < 1:
-            return  # No data to style
-
-        # 3) Styles
-        header_fill = PatternFill("solid", fgColor="1F4E79")  # Dark blue
-        header_font = Font(bold=True, color="FFFFFF")
-        header_alignment = Alignment(vertical="center", horizontal="center", wrap_text=True)
-
-        body_alignment = Alignment(
-            vertical="top",
-            horizontal="left",
-            wrap_text=wrap_text
-        )
-
-        thin = Side(style="thin", color="9E9E9E")
-        border_all = Border(left=thin, right=thin, top=thin, bottom=thin)
-
-        # 4) Apply header style
-        ws.row_dimensions[header_row].height = header_row_height
-        for c in range(1, max_col + 1):
-            cell = ws.cell(row=header_row, column=c)
-            cell.fill = header_fill
-            cell.font = header_font
-            cell.alignment = header_alignment
-            cell.border = border_all
-
-        # 5) Apply body style + borders + minimum row height
-        for r in range(header_row + 1, max_row + 1):
-            current_height = ws.row_dimensions[r].height or 0
-            ws.row_dimensions[r].height = max(current_height, min_row_height)
-            for c in range(1, max_col + 1):
-                cell = ws.cell(row=r, column=c)
-                cell.alignment = body_alignment
-                cell.border = border_all
-
-        # 6) Auto-fit column widths
-        max_width_cap = 60
-        min_width_floor = 10
-
-        for c in range(1, max_col + 1):
-            max_len = 0
-            for r in range(1, max_row + 1):
-                v = ws.cell(row=r, column=c).value
-                if v is None:
-                    continue
-                s = str(v)
-                # Handle multi-line text
-                longest_line = max((len(line) for line in s.splitlines()), default=len(s))
-                max_len = max(max_len, longest_line)
-            
-            # Add padding
-            width = min(max_width_cap, max(min_width_floor, int(max_len * 1.1) + 2))
-            ws.column_dimensions[get_column_letter(c)].width = width
-
-        # 7) Create Excel Table for AutoFilter + banded rows
-        start_cell = f"A{header_row}"
-        end_cell = f"{get_column_letter(max_col)}{max_row}"
-        table_ref = f"{start_cell}:{end_cell}"
-
+        Args:
+            ws: Worksheet to add the table to
+            table_ref: Cell range covered by the table, header row included
+            table_name: Preferred table name (suffixed if already taken)
+            table_style: Built-in table style name
+            column_names: Header names (openpyxl cannot read a write-only
+                sheet's cells back when saving)
+        """
         # Avoid duplicate table names
         existing_names = {t.name for t in ws._tables}
         original_table_name = table_name
@@ -118,11 +59,131 @@ class ExcelConverter:
             showRowStripes=True,
             showColumnStripes=False,
         )
-        ws.add_table(tab)
-
-        # 8) Enable auto-filter
+        tab._initialise_columns()
+        for col, name in zip(tab.tableColumns, column_names):
+            col.name = name
+        with warnings.catch_warnings():
+            # openpyxl warns for every write-only table, even with columns set
+            warnings.filterwarnings("ignore", message="In write-only mode")
+            ws.add_table(tab)
+    
+    @staticmethod
+    def write_styled_sheet(
+        wb: Workbook,
+        sheet_name: str,
+        df: pd.DataFrame,
+        table_name: str = "DataTable",
+        table_style: str = "TableStyleMedium9",
+        min_row_height: float = 18,
+        header_row_height: float = 26,
+    ) -> None:
+        """
+        Stream a DataFrame into a new sheet of a write-only workbook
+        
+        Freezes and styles the header row, sets column widths and row heights,
+        and adds an Excel Table (AutoFilter + banded rows). Styles are set on
+        each cell as its row is appended, so the sheet is never held in memory
+        as Cell objects.
+        
+        Args:
+            wb: Workbook created with write_only=True
+            sheet_name: Name of the sheet to create
+            df: Data to write (header row from df.columns)
+            table_name: Preferred Excel Table name
+            table_style: Built-in table style name
+            min_row_height: Height of body rows
+            header_row_height: Height of the header row
+        """
+        ws = wb.create_sheet(title=sheet_name)
+        
+        if len(df.columns) == 0:
+            return  # No data to style
+        
+        # Sheet-level settings must be in place before rows are streamed out
+        ws.freeze_panes = "A2"
+        ws.sheet_format.defaultRowHeight = min_row_height
+        ws.sheet_format.customHeight = True
+        column_letters = [get_column_letter(c) for c in range(1, len(df.columns) + 1)]
+        for column_letter, width in zip(column_letters, ExcelConverter.column_widths(df)):
+            ws.column_dimensions[column_letter].width = width
+        
+        # Header row
+        header = [str(col) for col in df.columns]
+        ws.row_dimensions[1].height = header_row_height
+        ws.append([ExcelConverter._styled_cell(ws, name, "translated_header") for name in header])
+        
+        # Body rows (NaN -> empty cell, numpy scalars -> Python values)
+        rows = df.astype(object).where(df.notna(), None).itertuples(index=False, name=None)
+        row_count = 0
+        for values in rows:
+            ws.append([ExcelConverter._styled_cell(ws, value, "translated_body") for value in values])
+            row_count += 1
+        
+        table_ref = f"A1:{column_letters[-1]}{row_count + 1}"
+        ExcelConverter._add_table(ws, table_ref, table_name, table_style, column_names=header)
         ws.auto_filter.ref = table_ref
     
+    @staticmethod
+    def _styled_cell(ws, value, style_name: str) -> WriteOnlyCell:
+        """Create a write-only cell carrying one of the workbook's named styles"""
+        cell = WriteOnlyCell(ws, value=value)
+        cell.style = style_name
+        return cell
+    
+    @staticmethod
+    def _register_named_styles(wb: Workbook, wrap_text: bool = True) -> None:
+        """
+        Register header/body named styles on a workbook
+        
+        Assigning a named style copies one precomputed style index, instead
+        of hashing fill/font/alignment/border on every cell.
+        """
+        header_style = NamedStyle(name="translated_header")
+        header_style.fill = _HEADER_FILL
+        header_style.font = _HEADER_FONT
+        header_style.alignment = _HEADER_ALIGNMENT
+        header_style.border = _BORDER_ALL
+        wb.add_named_style(header_style)
+        
+        body_style = NamedStyle(name="translated_body")
+        # NamedStyle defaults to an empty Font(); keep body text in the workbook default font
+        body_style.font = DEFAULT_FONT
+        body_style.alignment = _BODY_ALIGNMENT if wrap_text else _BODY_ALIGNMENT_NO_WRAP
+        wb.add_named_style(body_style)
+    
+    @staticmethod
+    def column_widths(df: pd.DataFrame, min_width: int = 10, max_width: int = 60) -> List[int]:
+        """
+        Compute display widths for each column of a DataFrame
+        
+        Args:
+            df: DataFrame about to be written to a sheet
+            min_width: Minimum column width
+            max_width: Maximum column width
+            
+        Returns:
+            List of column widths in column order
+        """
+        widths = []
+        for col in df.columns:
+            values = df[col].dropna().astype(str)
+            lengths = values.str.len()
+            
+            # Only multi-line cells need the slower per-line measurement
+            multiline = values.str.contains('\n', regex=False) | values.str.contains('\r', regex=False)
+            if multiline.any():
+                lengths[multiline] = values[multiline].map(
+                    lambda v: max((len(line) for line in v.splitlines()), default=0)
+                )
+            
+            header_len = max((len(line) for line in str(col).splitlines()), default=0)
+            max_len = max(int(lengths.max()) if len(lengths) else 0, header_len)
+            
+            # Add padding
+            widths.append(min(max_width, max(min_width, int(max_len * 1.1) + 2)))
+        
+        return widths
+    
     @staticmethod
     def excel_to_csv_dict(file_path: Path) -> Dict[str, str]:
         """
@@ -136,19 +197,101 @@ class ExcelConverter:
         """
         result = {}
         
-        # Read Excel file
-        excel_file = pd.ExcelFile(file_path)
-        
-        for sheet_name in excel_file.sheet_names:
-            df = pd.read_excel(excel_file, sheet_name=sheet_name)
-            
-            # Convert to CSV string
-            csv_buffer = StringIO()
-            df.to_csv(csv_buffer, index=False, encoding='utf-8')
-            result[sheet_name] = csv_buffer.getvalue()
+        # read_only streams rows lazily; data_only returns cached formula
+        # results instead of formula strings
+        wb = load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            for sheet_name in wb.sheetnames:
+                ws = wb[sheet_name]
+                # Don't trust the stored <dimension> tag: some writers leave
+                # it stale (e.g. "A1"), which would silently cut rows off
+                ws.reset_dimensions()
+                rows = list(ws.iter_rows(values_only=True))
+                
+                # Drop trailing blank rows and columns, as pandas does
+                while rows and all(value is None for value in rows[-1]):
+                    rows.pop()
+                width = max(
+                    (max((i + 1 for i, value in enumerate(row) if value is not None), default=0) for row in rows),
+                    default=0
+                )
+                
+                csv_buffer = StringIO()
+                if rows:
+                    writer = csv.writer(csv_buffer, lineterminator='\n')
+                    header = tuple(rows[0][:width]) + (None,) * (width - len(rows[0]))
+                    writer.writerow(ExcelConverter._header_names(header))
+                    
+                    body = [row[:width] for row in rows[1:]]
+                    date_columns = ExcelConverter._date_only_columns(body)
+                    if date_columns:
+                        # Like pandas, write all-midnight datetime columns as plain dates
+                        body = [
+                            tuple(
+                                value.date() if i in date_columns and value is not None else value
+                                for i, value in enumerate(row)
+                            )
+                            for row in body
+                        ]
+                    writer.writerows(body)
+                
+                result[sheet_name] = csv_buffer.getvalue()
+        finally:
+            # Read-only workbooks keep the file handle open until closed
+            wb.close()
         
         return result
     
+    @staticmethod
+    def _date_only_columns(rows: List[tuple]) -> Set[int]:
+        """
+        Find columns whose values are all datetimes at midnight
+        
+        pandas.read_excel parses such a column as datetime64 and to_csv
+        writes it as "2024-01-01" rather than "2024-01-01 00:00:00".
+        Empty cells are ignored; a column with no values is not a date column.
+        """
+        candidates = set(range(max((len(row) for row in rows), default=0)))
+        seen = set()
+        
+        for row in rows:
+            for i in list(candidates):
+                value = row[i] if i < len(row) else None
+                if value is None:
+                    continue
+                if isinstance(value, datetime) and value.time() == dt_time.min:
+                    seen.add(i)
+                else:
+                    candidates.discard(i)
+            if not candidates:
+                break
+        
+        return candidates & seen
+    
+    @staticmethod
+    def _header_names(header: tuple) -> List[str]:
+        """
+        Name header cells the way pandas.read_excel does
+        
+        Empty cells become "Unnamed: <index>" and repeated names get the
+        first free ".1", ".2", ... suffix, so column names stay unique.
+        """
+        names = [f"Unnamed: {i}" if value is None else str(value) for i, value in enumerate(header)]
+        original = set(names)
+        used = set()
+        counts = {}
+        
+        for i, name in enumerate(names):
+            if name in used:
+                base = name
+                while name in used or name in original:
+                    counts[base] = counts.get(base, 0) + 1
+                    name = f"{base}.{counts[base]}"
+                names[i] = name
+            used.add(name)
+        
+        return names
+    
     @staticmethod
     def csv_to_excel(csv_dict: Dict[str, str], output_path: Path) -> None:
         """
@@ -158,46 +301,61 @@ class ExcelConverter:
             csv_dict: Dict with sheet names as keys and CSV strings as values
             output_path: Path to save Excel file
         """
-        with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
-            for idx, (sheet_name, csv_content) in enumerate(csv_dict.items(), 1):
-                try:
-                    # Read CSV with proper handling of quotes and delimiters
-                    df = pd.read_csv(
-                        StringIO(csv_content),
-                        quotechar='"',
-                        escapechar='\\',
-                        on_bad_lines='skip',  # Skip malformed lines instead of warning
-                        engine='python',
-                        encoding='utf-8'
-                    )
-                    
-                    # Log if rows were skipped
-                    expected_rows = csv_content.count('\n')
-                    actual_rows = len(df)
-                    if actual_rows < expected_rows - 1:
-                        logger.warning(f"Sheet '{sheet_name}': {expected_rows - actual_rows - 1} rows skipped due to CSV format issues")
-                    
-                    df.to_excel(writer, sheet_name=sheet_name, index=False)
-                except Exception as e:
-                    logger.error(f"Error converting sheet '{sheet_name}': {str(e)}")
-                    # Create empty dataframe as fallback
-                    df = pd.DataFrame()
-                    df.to_excel(writer, sheet_name=sheet_name, index=False)
-        
-        # Apply styling after all sheets are written
-        wb = load_workbook(output_path)
-        for idx, sheet_name in enumerate(csv_dict.keys(), 1):
-            if sheet_name in wb.sheetnames:
-                ws = wb[sheet_name]
-                ExcelConverter.apply_excel_styling(
-                    ws,
-                    header_row=1,
-                    freeze_panes_cell="A2",
-                    table_name=f"Table{idx}",
-                    table_style="TableStyleMedium9"
-                )
+        # Write-only workbook: rows are streamed to disk as they are appended
+        wb = Workbook(write_only=True)
+        ExcelConverter._register_named_styles(wb)
+        
+        for idx, (sheet_name, csv_content) in enumerate(csv_dict.items(), 1):
+            try:
+                df = ExcelConverter._read_csv_string(csv_content)
+                
+                # Log if rows were skipped
+                expected_rows = csv_content.count('\n')
+                actual_rows = len(df)
+                if actual_rows < expected_rows - 1:
+                    logger.warning(f"Sheet '{sheet_name}': {expected_rows - actual_rows - 1} rows skipped due to CSV format issues")
+            except Exception as e:
+                logger.error(f"Error converting sheet '{sheet_name}': {str(e)}")
+                # Create empty dataframe as fallback
+                df = pd.DataFrame()
+            
+            ExcelConverter.write_styled_sheet(
+                wb,
+                sheet_name,
+                df,
+                table_name=f"Table{idx}",
+                table_style="TableStyleMedium9"
+            )
+        
         wb.save(output_path)
     
+    @staticmethod
+    def _read_csv_string(csv_content: str) -> pd.DataFrame:
+        """
+        Parse a CSV string into a DataFrame
+        
+        Uses pandas' C parser, retrying with the python engine only if the
+        C tokenizer rejects the input.
+        
+        Args:
+            csv_content: CSV content as string
+            
+        Returns:
+            Parsed DataFrame
+        """
+        # Read CSV with proper handling of quotes and delimiters
+        read_kwargs = dict(
+            quotechar='"',
+            escapechar='\\',
+            on_bad_lines='skip',  # Skip malformed lines instead of warning
+            encoding='utf-8'
+        )
+        try:
+            return pd.read_csv(StringIO(csv_content), **read_kwargs)
+        except pd.errors.ParserError as e:
+            logger.warning(f"C parser failed ({str(e)}), retrying with python engine")
+            return pd.read_csv(StringIO(csv_content), engine='python', **read_kwargs)
+    
     @staticmethod
     def csv_file_to_string(file_path: Path) -> str:
         """
@@ -214,6 +372,73 @@ class ExcelConverter:
         with open(file_path, 'r', encoding=encoding) as f:
             return f.read()
     
+    @staticmethod
+    def iter_csv_chunks(file_path: Path, rows_per_chunk: int = 500) -> Iterator[str]:
+        """
+        Stream CSV file as CSV strings without reading it whole
+        
+        Args:
+            file_path: Path to CSV file
+            rows_per_chunk: Maximum number of data rows per chunk
+            
+        Yields:
+            CSV strings, each starting with the header row
+        """
+        encoding, _ = detect_encoding(file_path)
+        
+        with open(file_path, 'r', encoding=encoding, newline='') as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is None:
+                return
+            
+            rows = []
+            for row in reader:
+                rows.append(row)
+                if len(rows) >= rows_per_chunk:
+                    yield ExcelConverter._rows_to_csv(header, rows)
+                    rows = []
+            
+            if rows:
+                yield ExcelConverter._rows_to_csv(header, rows)
+    
+    @staticmethod
+    def count_csv_rows(file_path: Path) -> int:
+        """
+        Count the data rows of a CSV file without loading it
+        
+        Args:
+            file_path: Path to CSV file
+            
+        Returns:
+            Number of rows after the header that csv.DictReader would yield
+        """
+        encoding, _ = detect_encoding(file_path)
+        with open(file_path, 'r', encoding=encoding, newline='') as f:
+            return ExcelConverter._count_data_rows(f)
+    
+    @staticmethod
+    def count_csv_string_rows(csv_content: str) -> int:
+        """Count the data rows of a CSV string, as count_csv_rows does for a file"""
+        return ExcelConverter._count_data_rows(StringIO(csv_content))
+    
+    @staticmethod
+    def _count_data_rows(lines: Iterable[str]) -> int:
+        """Count non-blank CSV records after the header (DictReader skips blank lines)"""
+        reader = csv.reader(lines)
+        if next(reader, None) is None:
+            return 0
+        return sum(1 for row in reader if row)
+    
+    @staticmethod
+    def _rows_to_csv(header: list, rows: list) -> str:
+        """Write header and rows to a CSV string"""
+        csv_buffer = StringIO()
+        writer = csv.writer(csv_buffer)
+        writer.writerow(header)
+        writer.writerows(rows)
+        return csv_buffer.getvalue()
+    
     @staticmethod
     def csv_string_to_file(csv_content: str, output_path: Path) -> None:
         """
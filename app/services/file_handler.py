@@ -1,9 +1,13 @@
 from pathlib import Path
 from fastapi import UploadFile
-import uuid
-import shutil
+import aiofiles
+import secrets
+import time
 from app.core.config import settings
-from app.utils.validators import validate_file_extension, validate_file_size
+from app.utils.validators import get_file_extension, validate_file_size
+
+# Read/write uploads in 1MB chunks: far fewer syscalls than copyfileobj's 64KB default
+UPLOAD_CHUNK_SIZE = 1 << 20
 
 
 class FileHandler:
@@ -17,28 +21,38 @@ class FileHandler:
     async def save_upload_file(self, upload_file: UploadFile) -> Path:
         """
         Save uploaded file to temp directory
-        """
-        # Validate extension
-        validate_file_extension(upload_file.filename)
         
+        The caller validates the extension and declared size. The size limit
+        is enforced again while streaming, so an oversized upload is rejected
+        as soon as it crosses the limit instead of after it has been written
+        to disk in full.
+        
+        Args:
+            upload_file: Uploaded file
+            
+        Returns:
+            Path to the saved file
+            
+        Raises:
+            InvalidFileFormatError: If file too large
+        """
         # Generate unique filename
-        file_ext = Path(upload_file.filename).suffix
-        unique_filename = f"{uuid.uuid4()}{file_ext}"
+        file_ext = get_file_extension(upload_file.filename)
+        unique_filename = f"{secrets.token_urlsafe(12)}{file_ext}"
         file_path = self.temp_dir / unique_filename
         
-        # Save file (using thread pool for blocking IO)
-        import asyncio
-        from functools import partial
-        
-        def save_sync():
-            with open(file_path, "wb") as buffer:
-                shutil.copyfileobj(upload_file.file, buffer)
-        
-        await asyncio.to_thread(save_sync)
-        
-        # Validate size
-        file_size = file_path.stat().st_size
-        validate_file_size(file_size)
+        # Stream to disk in large chunks without blocking the event loop
+        file_size = 0
+        try:
+            async with aiofiles.open(file_path, "wb") as buffer:
+                while chunk := await upload_file.read(UPLOAD_CHUNK_SIZE):
+                    file_size += len(chunk)
+                    validate_file_size(file_size)
+                    await buffer.write(chunk)
+        except BaseException:
+            # Don't leave a partial upload behind
+            file_path.unlink(missing_ok=True)
+            raise
         
         return file_path
     
@@ -52,6 +66,32 @@ class FileHandler:
         if file_path and file_path.exists():
             file_path.unlink()
     
+    def cleanup_stale_files(self, max_age_seconds: int) -> int:
+        """
+        Delete temp files older than max_age_seconds
+        
+        Args:
+            max_age_seconds: Age after which a file is considered stale
+            
+        Returns:
+            Number of files deleted
+        """
+        cutoff = time.time() - max_age_seconds
+        removed = 0
+        
+        for file_path in self.temp_dir.iterdir():
+            # Keep dotfiles such as .gitkeep
+            if file_path.name.startswith(".") or not file_path.is_file():
+                continue
+            try:
+                if file_path.stat().st_mtime < cutoff:
+                    file_path.unlink(missing_ok=True)
+                    removed += 1
+            except OSError:
+                continue
+        
+        return removed
+    
     def generate_output_filename(self, original_filename: str) -> str:
         """
         Generate output filename
@@ -1,15 +1,160 @@
-from openai import OpenAI
-from typing import Dict, List, Optional, Callable
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient, DefaultHttpxClient, OpenAI
+from typing import Dict, Iterable, Iterator, List, Optional, Callable, Tuple
+from app.core.config import settings
 from app.core.exceptions import GPTAPIError
 from app.core.prompts import SYSTEM_PROMPT_JSON, generate_user_prompt_json
 import re
 import logging
-import json
+import orjson
 import csv
+import pandas as pd
+import asyncio
+import httpx
+import threading
+import weakref
+from collections import Counter, OrderedDict
+from functools import lru_cache
 from io import StringIO
 
+try:
+    import tiktoken
+except ImportError:  # Optional: fall back to a byte-length estimate
+    tiktoken = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:  # Optional: fall back to csv.DictReader
+    pa = None
+    pacsv = None
+
 logger = logging.getLogger(__name__)
 
+# System prompt is constant, so serialize it once at import
+_SYSTEM_PROMPT_JSON_STR = orjson.dumps(SYSTEM_PROMPT_JSON).decode('utf-8')
+
+# Markdown code fences (```csv, ```) and "(Sheet name: ...)" lines GPT sometimes adds
+_MARKDOWN_FENCE_RE = re.compile(r'```(?:csv\n|\n)?')
+_SHEET_ANNOTATION_RE = re.compile(r'^[ \t]*\((?:Sheet name|시트 이름):[^\n]*\n?', re.MULTILINE)
+
+# Short cell values (labels, status codes, categories) repeated across rows are
+# translated once; longer text keeps going to GPT with its row for context
+GLOSSARY_MAX_CHARS = 50
+GLOSSARY_MAX_WORDS = 3
+GLOSSARY_CACHE_SIZE = 10000
+
+# Translations of such values, shared across jobs: (model, source, target, value) -> text
+_glossary_cache: "OrderedDict[Tuple[str, str, str, str], str]" = OrderedDict()
+_glossary_lock = threading.Lock()
+
+
+def _is_glossary_candidate(value) -> bool:
+    """Check whether a cell value is short label-like text worth translating once"""
+    return (
+        isinstance(value, str)
+        and len(value) <= GLOSSARY_MAX_CHARS
+        and len(value.split()) <= GLOSSARY_MAX_WORDS
+        and any(ch.isalpha() for ch in value)
+    )
+
+
+def _glossary_get(key: Tuple[str, str, str, str]) -> Optional[str]:
+    """Look up a cached value translation, marking it recently used"""
+    with _glossary_lock:
+        translated = _glossary_cache.get(key)
+        if translated is not None:
+            _glossary_cache.move_to_end(key)
+        return translated
+
+
+def _glossary_put(key: Tuple[str, str, str, str], translated: str):
+    """Cache a value translation, evicting the least recently used entry when full"""
+    with _glossary_lock:
+        _glossary_cache[key] = translated
+        _glossary_cache.move_to_end(key)
+        if len(_glossary_cache) > GLOSSARY_CACHE_SIZE:
+            _glossary_cache.popitem(last=False)
+
+
+# BPE files behind the encodings of current OpenAI models; tiktoken downloads
+# them on first use, so they are loaded once at startup in a thread
+_PRELOAD_ENCODINGS = ("o200k_base", "cl100k_base")
+
+
+def preload_token_encoders() -> None:
+    """Load tiktoken encodings ahead of the first job (blocking, run it in a thread)"""
+    if tiktoken is None:
+        return
+    for name in _PRELOAD_ENCODINGS:
+        try:
+            tiktoken.get_encoding(name)
+        except Exception as e:
+            logger.warning(f"Could not load tiktoken encoding {name}: {str(e)}")
+
+
+# Keyed by the model name a request asks for, so keep it bounded
+@lru_cache(maxsize=32)
+def _get_token_encoder(model: str):
+    """Get the tiktoken encoding for a model, or None if unavailable"""
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        # Model newer than the installed tiktoken; use the current GPT-4o family encoding
+        return tiktoken.get_encoding("o200k_base")
+    except Exception:
+        # e.g. encoding files cannot be downloaded
+        return None
+
+
+def _count_tokens(text: str, model: str) -> int:
+    """Count tokens in text"""
+    encoder = _get_token_encoder(model)
+    if encoder is None:
+        # ~1 token per 3 UTF-8 bytes: conservative for English, close for Korean
+        return len(text.encode('utf-8')) // 3 + 1
+    return len(encoder.encode(text))
+
+
+# One HTTP connection pool shared by every OpenAI client, so keep-alive
+# connections are reused across jobs. OpenAI clients themselves are cheap and
+# built per job: keeping one per submitted API key would hold every user's key
+# (and a pool) in memory until shutdown.
+_http_client: Optional[httpx.Client] = None
+_http_client_lock = threading.Lock()
+
+
+def get_http_client() -> httpx.Client:
+    """Get the shared sync HTTP client, creating it on first use"""
+    global _http_client
+    if _http_client is None:
+        with _http_client_lock:
+            if _http_client is None:
+                _http_client = DefaultHttpxClient()
+    return _http_client
+
+
+# Async connections are bound to the event loop they were opened on, so the
+# async HTTP client is shared per event loop
+_async_http_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """Get the async HTTP client for the running event loop, creating it on first use"""
+    loop = asyncio.get_running_loop()
+    client = _async_http_clients.get(loop)
+    if client is None:
+        client = _async_http_clients[loop] = DefaultAsyncHttpxClient()
+    return client
+
+
+async def close_async_clients() -> None:
+    """Close the async HTTP client created on the running event loop"""
+    client = _async_http_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
 
 class TranslationService:
     """Handle GPT-based translation"""
@@ -21,17 +166,73 @@ class TranslationService:
         Args:
             api_key: OpenAI API key
             model: GPT model to use
-            progress_callback: Optional callback function for progress updates
+            progress_callback: Optional callback function for progress updates,
+                called as ('rows_complete', count) as sheet rows are translated
         """
-        self.client = OpenAI(api_key=api_key)
+        self.api_key = api_key
         self.model = model
         self.progress_callback = progress_callback
+        self._client: Optional[OpenAI] = None
+        self._async_client: Optional[AsyncOpenAI] = None
+        self._async_client_loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    @property
+    def client(self) -> OpenAI:
+        """Sync OpenAI client for this service (created on first use)"""
+        if self._client is None:
+            self._client = OpenAI(api_key=self.api_key, http_client=get_http_client())
+        return self._client
+    
+    def _get_async_client(self) -> AsyncOpenAI:
+        """AsyncOpenAI client for this service on the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
+            self._async_client = AsyncOpenAI(api_key=self.api_key, http_client=get_async_http_client())
+            self._async_client_loop = loop
+        return self._async_client
     
     def _csv_to_json(self, csv_content: str) -> List[Dict]:
         """Convert CSV string to JSON array of objects"""
+        if pacsv is not None:
+            rows = self._csv_to_json_arrow(csv_content)
+            if rows is not None:
+                return rows
+        
         reader = csv.DictReader(StringIO(csv_content))
         return list(reader)
     
+    def _csv_to_json_arrow(self, csv_content: str) -> Optional[List[Dict]]:
+        """
+        Convert CSV string to JSON array of objects with pyarrow's C++ parser
+        
+        Returns None when the input needs csv.DictReader's semantics instead
+        (empty input, duplicate header names, ragged rows, or a header that
+        arrow parses differently, e.g. one starting with a BOM).
+        """
+        header = next(csv.reader(StringIO(csv_content)), None)
+        if not header or len(set(header)) != len(header):
+            return None
+        
+        try:
+            # Arrow reads the header itself: it may span several lines when quoted
+            table = pacsv.read_csv(
+                pa.py_buffer(csv_content.encode('utf-8')),
+                parse_options=pacsv.ParseOptions(newlines_in_values=True),
+                # Keep every cell as text, empty cells as "" (like DictReader)
+                convert_options=pacsv.ConvertOptions(
+                    column_types={name: pa.string() for name in header},
+                    strings_can_be_null=False,
+                    quoted_strings_can_be_null=False
+                )
+            )
+        except pa.ArrowInvalid:
+            return None
+        
+        if table.column_names != header:
+            return None
+        
+        return table.to_pylist()
+    
     def _json_to_csv(self, json_data: List[Dict]) -> str:
         """Convert JSON array of objects to CSV string, preserving original column order"""
         if not json_data:
@@ -64,11 +265,10 @@ class TranslationService:
             fieldnames.extend(sorted(extra_keys))
             logger.warning(f"Found extra keys in some rows: {extra_keys}")
         
-        output = StringIO()
-        writer = csv.DictWriter(output, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(json_data)
-        return output.getvalue()
+        # Vectorized C writer; object dtype keeps values as-is (no int/float coercion),
+        # and missing keys become empty cells like DictWriter's restval
+        df = pd.DataFrame(json_data, columns=fieldnames, dtype=object)
+        return df.to_csv(index=False, lineterminator='\r\n')
     
     def translate_csv(
         self,
@@ -93,131 +293,439 @@ class TranslationService:
         Raises:
             GPTAPIError: If API call fails
         """
+        return self.translate_csv_chunks([csv_content], source_lang, target_lang, sheet_name)
+    
+    def translate_csv_chunks(
+        self,
+        csv_chunks: Iterable[str],
+        source_lang: str,
+        target_lang: str,
+        sheet_name: str = ""
+    ) -> str:
+        """
+        Translate a sheet supplied as consecutive CSV chunks
+        
+        Synchronous wrapper around translate_csv_chunks_async for callers
+        that are not running inside an event loop.
+        
+        Args:
+            csv_chunks: Iterable of CSV formatted strings
+            source_lang: Source language code (e.g., 'ko', 'en')
+            target_lang: Target language code (e.g., 'en', 'ko')
+            sheet_name: Optional sheet name for context
+            
+        Returns:
+            Translated CSV string (all chunks combined)
+            
+        Raises:
+            GPTAPIError: If API call fails
+        """
+        return self._run_sync(
+            self.translate_csv_chunks_async(csv_chunks, source_lang, target_lang, sheet_name)
+        )
+    
+    async def translate_csv_chunks_async(
+        self,
+        csv_chunks: Iterable[str],
+        source_lang: str,
+        target_lang: str,
+        sheet_name: str = ""
+    ) -> str:
+        """
+        Translate a sheet supplied as consecutive CSV chunks
+        
+        Each chunk must start with the header row. Chunks are consumed
+        lazily, so a streaming iterator is never fully materialized.
+        
+        Args:
+            csv_chunks: Iterable of CSV formatted strings
+            source_lang: Source language code (e.g., 'ko', 'en')
+            target_lang: Target language code (e.g., 'en', 'ko')
+            sheet_name: Optional sheet name for context
+            
+        Returns:
+            Translated CSV string (all chunks combined)
+            
+        Raises:
+            GPTAPIError: If API call fails
+        """
+        translated_json = []
+        chunk_iter = iter(csv_chunks)
+        
+        while True:
+            # Reading and parsing a chunk may hit the disk, so keep it off the event loop
+            json_data = await asyncio.to_thread(self._next_chunk_json, chunk_iter)
+            if json_data is None:
+                break
+            
+            translated_json.extend(await self._translate_rows(json_data, source_lang, target_lang))
+        
+        return await asyncio.to_thread(self._json_to_csv, translated_json)
+    
+    def _next_chunk_json(self, chunk_iter: Iterator[str]) -> Optional[List[Dict]]:
+        """Read the next CSV chunk and convert it to JSON, or return None when exhausted"""
+        csv_content = next(chunk_iter, None)
+        if csv_content is None:
+            return None
+        
         # Convert CSV to JSON for better structure
         try:
             json_data = self._csv_to_json(csv_content)
             logger.info(f"Converted CSV to JSON: {len(json_data)} rows")
+            return json_data
         except Exception as e:
             logger.error(f"Failed to convert CSV to JSON: {str(e)}")
             raise GPTAPIError(f"CSV parsing failed: {str(e)}")
+    
+    async def _translate_rows(
+        self,
+        json_data: List[Dict],
+        source_lang: str,
+        target_lang: str
+    ) -> List[Dict]:
+        """
+        Translate rows, translating repeated short values only once
         
-        # Check if data needs to be chunked (based on row count)
-        # Very conservative: 5 rows = ~2-3k tokens with long text data
-        # This ensures we stay well under the 16k token limit even with very long content
-        CHUNK_SIZE = 5
-        
-        if len(json_data) > CHUNK_SIZE:
-            logger.info(f"Large dataset detected ({len(json_data)} rows). Splitting into chunks of {CHUNK_SIZE} rows.")
-            return self._translate_in_chunks(json_data, source_lang, target_lang, CHUNK_SIZE)
+        Cells whose value is in the glossary are filled in locally; only the
+        remaining cells of each row are sent to GPT.
         
-        # For small datasets, translate directly
-        translated_json = self._translate_json_data(json_data, source_lang, target_lang)
-        return self._json_to_csv(translated_json)
+        Args:
+            json_data: List of dictionaries representing CSV rows
+            source_lang: Source language code
+            target_lang: Target language code
+            
+        Returns:
+            Translated JSON data (List of dicts)
+        """
+        glossary = await self._build_glossary(json_data, source_lang, target_lang)
+        if not glossary:
+            return await self._translate_rows_with_gpt(json_data, source_lang, target_lang, report_progress=True)
+        
+        def in_glossary(value) -> bool:
+            return isinstance(value, str) and value in glossary
+        
+        pending_indices = []
+        pending_rows = []
+        for i, row in enumerate(json_data):
+            remaining = {key: value for key, value in row.items() if not in_glossary(value)}
+            if remaining:
+                pending_indices.append(i)
+                pending_rows.append(remaining)
+        
+        logger.info(f"Glossary covers {len(glossary)} repeated values; sending {len(pending_rows)}/{len(json_data)} rows to GPT")
+        
+        # Rows filled entirely from the glossary are already done
+        self._report_rows(len(json_data) - len(pending_rows))
+        
+        translated_rows = {}
+        if pending_rows:
+            translated = await self._translate_rows_with_gpt(pending_rows, source_lang, target_lang, report_progress=True)
+            if len(translated) != len(pending_rows):
+                # A dropped or extra row shifts every later pairing, so retry once
+                logger.warning(f"⚠️ GPT returned {len(translated)} of {len(pending_rows)} rows; retrying them")
+                translated = await self._translate_rows_with_gpt(pending_rows, source_lang, target_lang)
+            if len(translated) == len(pending_rows):
+                translated_rows = dict(zip(pending_indices, translated))
+            else:
+                logger.warning(f"⚠️ GPT returned {len(translated)} of {len(pending_rows)} rows again; keeping their original text")
+        
+        # Reassemble rows in their original column order
+        result = []
+        for i, row in enumerate(json_data):
+            translated_row = translated_rows.get(i)
+            if not isinstance(translated_row, dict):
+                translated_row = {}
+            result.append({
+                key: glossary[value] if in_glossary(value) else translated_row.get(key, value)
+                for key, value in row.items()
+            })
+        
+        return result
     
-    def _translate_json_data(
+    async def _build_glossary(
         self,
         json_data: List[Dict],
         source_lang: str,
         target_lang: str
+    ) -> Dict[str, str]:
+        """
+        Translate short values that repeat across cells, once each
+        
+        Args:
+            json_data: List of dictionaries representing CSV rows
+            source_lang: Source language code
+            target_lang: Target language code
+            
+        Returns:
+            Dict mapping original values to their translations
+        """
+        counts = Counter(
+            value for row in json_data for value in row.values()
+            if _is_glossary_candidate(value)
+        )
+        
+        glossary = {}
+        missing = []
+        for value, count in counts.items():
+            translated = _glossary_get((self.model, source_lang, target_lang, value))
+            if translated is not None:
+                glossary[value] = translated
+            elif count > 1:
+                missing.append(value)
+        
+        if not missing:
+            return glossary
+        
+        logger.info(f"Translating {len(missing)} repeated values once instead of per cell")
+        translated = await self._translate_rows_with_gpt(
+            [{"v": value} for value in missing],
+            source_lang,
+            target_lang
+        )
+        
+        # A dropped entry would shift every later pairing, so only trust a complete reply
+        if len(translated) != len(missing):
+            logger.warning(f"⚠️ Glossary reply has {len(translated)} of {len(missing)} values; translating them in context instead")
+            return glossary
+        
+        for value, row in zip(missing, translated):
+            translated_value = row.get("v") if isinstance(row, dict) else None
+            if isinstance(translated_value, str):
+                glossary[value] = translated_value
+                _glossary_put((self.model, source_lang, target_lang, value), translated_value)
+        
+        return glossary
+    
+    async def _translate_rows_with_gpt(
+        self,
+        json_data: List[Dict],
+        source_lang: str,
+        target_lang: str,
+        report_progress: bool = False
     ) -> List[Dict]:
         """
-        Translate JSON data directly (for small datasets)
+        Translate rows, splitting them into chunks when needed
         
         Args:
             json_data: List of dictionaries representing CSV rows
             source_lang: Source language code
             target_lang: Target language code
+            report_progress: Report translated rows to the progress callback
+                (False for glossary lookups, which are not sheet rows)
             
         Returns:
             Translated JSON data (List of dicts)
         """
+        # Check if data needs to be chunked (based on prompt tokens);
+        # tokenizing is CPU work, so keep it off the event loop
+        chunks = await asyncio.to_thread(self._pack_chunks, json_data)
+        
+        if len(chunks) > 1:
+            logger.info(f"Large dataset detected ({len(json_data)} rows). Splitting into {len(chunks)} chunks of up to {settings.CHUNK_TOKEN_BUDGET:,} tokens.")
+            return await self._translate_in_chunks_async(chunks, source_lang, target_lang, report_progress)
+        
+        # For small datasets, translate directly
+        translated = await self._translate_json_data_async(json_data, source_lang, target_lang)
+        if report_progress:
+            self._report_rows(len(json_data))
+        return translated
+    
+    def _report_rows(self, count: int):
+        """Tell the progress callback that count more sheet rows are translated"""
+        if self.progress_callback and count:
+            self.progress_callback('rows_complete', count)
+    
+    def _pack_chunks(self, json_data: List[Dict]) -> List[List[Dict]]:
+        """
+        Greedily pack rows into chunks of at most CHUNK_TOKEN_BUDGET prompt tokens
+        
+        Short-text sheets fit many rows per request, while long-text rows get
+        chunks of their own, so the 16k completion limit is not exceeded.
+        A single row larger than the budget still gets its own chunk.
+        
+        Args:
+            json_data: List of dictionaries representing CSV rows
+            
+        Returns:
+            List of row chunks, in input order
+        """
+        budget = settings.CHUNK_TOKEN_BUDGET
+        chunks = []
+        current = []
+        current_tokens = 0
+        
+        for row in json_data:
+            row_tokens = _count_tokens(
+                orjson.dumps(row, option=orjson.OPT_NON_STR_KEYS).decode('utf-8'),
+                self.model
+            )
+            if current and current_tokens + row_tokens > budget:
+                chunks.append(current)
+                current = []
+                current_tokens = 0
+            current.append(row)
+            current_tokens += row_tokens
+        
+        if current:
+            chunks.append(current)
+        
+        return chunks
+    
+    def _build_messages(
+        self,
+        json_data: List[Dict],
+        source_lang: str,
+        target_lang: str
+    ) -> List[Dict]:
+        """Build the chat messages for a translation request"""
         # Generate structured JSON prompt using centralized function
         prompt_structure = generate_user_prompt_json(source_lang, target_lang, json_data)
-        user_prompt = json.dumps(prompt_structure, ensure_ascii=False, indent=2)
+        # Compact, non-ASCII-escaped output: GPT doesn't need indentation, and it costs prompt tokens
+        # (non-str keys: csv.DictReader stores surplus fields under None)
+        user_prompt = orjson.dumps(prompt_structure, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
         
         logger.info(f"JSON prompt structure created with {len(json_data)} rows")
         
-        try:
-            # Log the prompts for debugging
-            logger.info(f"=== Translation Request ===")
-            logger.info(f"Model: {self.model}")
-            logger.info(f"Source: {source_lang} -> Target: {target_lang}")
-            logger.info(f"Rows to translate: {len(json_data)}")
+        # Log the prompts for debugging
+        logger.info(f"=== Translation Request ===")
+        logger.info(f"Model: {self.model}")
+        logger.info(f"Source: {source_lang} -> Target: {target_lang}")
+        logger.info(f"Rows to translate: {len(json_data)}")
+        
+        return [
+            {"role": "system", "content": _SYSTEM_PROMPT_JSON_STR},
+            {"role": "user", "content": user_prompt}
+        ]
+    
+    def _translate_json_data(
+        self,
+        json_data: List[Dict],
+        source_lang: str,
+        target_lang: str
+    ) -> List[Dict]:
+        """
+        Translate JSON data directly (for small datasets)
+        
+        Args:
+            json_data: List of dictionaries representing CSV rows
+            source_lang: Source language code
+            target_lang: Target language code
             
+        Returns:
+            Translated JSON data (List of dicts)
+        """
+        try:
             # Use JSON mode for structured output with centralized prompts
             response = self.client.chat.completions.create(
                 model=self.model,
-                messages=[
-                    {"role": "system", "content": json.dumps(SYSTEM_PROMPT_JSON, ensure_ascii=False)},
-                    {"role": "user", "content": user_prompt}
-                ],
+                messages=self._build_messages(json_data, source_lang, target_lang),
+                temperature=0.3,
+                max_tokens=16000,
+                response_format={"type": "json_object"}
+            )
+            return self._parse_response(response, json_data)
+        except Exception as e:
+            raise GPTAPIError(f"GPT API call failed: {str(e)}")
+    
+    async def _translate_json_data_async(
+        self,
+        json_data: List[Dict],
+        source_lang: str,
+        target_lang: str
+    ) -> List[Dict]:
+        """
+        Translate JSON data directly with the async client
+        
+        Args:
+            json_data: List of dictionaries representing CSV rows
+            source_lang: Source language code
+            target_lang: Target language code
+            
+        Returns:
+            Translated JSON data (List of dicts)
+        """
+        try:
+            response = await self._get_async_client().chat.completions.create(
+                model=self.model,
+                messages=self._build_messages(json_data, source_lang, target_lang),
                 temperature=0.3,
                 max_tokens=16000,
                 response_format={"type": "json_object"}
             )
+            return self._parse_response(response, json_data)
+        except Exception as e:
+            raise GPTAPIError(f"GPT API call failed: {str(e)}")
+    
+    def _parse_response(self, response, json_data: List[Dict]) -> List[Dict]:
+        """
+        Extract translated rows from a chat completion response
+        
+        Args:
+            response: Chat completion response
+            json_data: Rows that were sent for translation
             
-            translated_content = response.choices[0].message.content
+        Returns:
+            Translated JSON data (List of dicts)
+        """
+        translated_content = response.choices[0].message.content
+        
+        if translated_content is None:
+            raise GPTAPIError("GPT returned empty response")
+        
+        # Log token usage and cost
+        usage = response.usage
+        if usage:
+            prompt_tokens = usage.prompt_tokens
+            completion_tokens = usage.completion_tokens
+            total_tokens = usage.total_tokens
             
-            if translated_content is None:
-                raise GPTAPIError("GPT returned empty response")
+            cost = self._calculate_cost(self.model, prompt_tokens, completion_tokens)
             
-            # Log token usage and cost
-            usage = response.usage
-            if usage:
-                prompt_tokens = usage.prompt_tokens
-                completion_tokens = usage.completion_tokens
-                total_tokens = usage.total_tokens
-                
-                cost = self._calculate_cost(self.model, prompt_tokens, completion_tokens)
-                
-                logger.info(f"=== Token Usage ===")
-                logger.info(f"Prompt tokens: {prompt_tokens:,}")
-                logger.info(f"Completion tokens: {completion_tokens:,}")
-                logger.info(f"Total tokens: {total_tokens:,}")
-                logger.info(f"Estimated cost: ${cost:.6f}")
+            logger.info(f"=== Token Usage ===")
+            logger.info(f"Prompt tokens: {prompt_tokens:,}")
+            logger.info(f"Completion tokens: {completion_tokens:,}")
+            logger.info(f"Total tokens: {total_tokens:,}")
+            logger.info(f"Estimated cost: ${cost:.6f}")
+        
+        # Parse JSON response
+        try:
+            translated_json = orjson.loads(translated_content)
             
-            # Parse JSON response
-            try:
-                translated_json = json.loads(translated_content)
-                
-                # Handle both array and object with array
-                if isinstance(translated_json, dict):
-                    # Look for 'input_data' key first (our expected format)
-                    if 'input_data' in translated_json and isinstance(translated_json['input_data'], list):
-                        translated_json = translated_json['input_data']
-                        logger.info("Extracted 'input_data' array from response")
-                    else:
-                        # Fallback: find any list in the response
-                        for key in translated_json:
-                            if isinstance(translated_json[key], list) and key != 'rules':
-                                translated_json = translated_json[key]
-                                logger.info(f"Extracted '{key}' array from response")
-                                break
-                
-                # Ensure it's a list
-                if not isinstance(translated_json, list):
-                    raise GPTAPIError(f"Expected JSON array, got {type(translated_json)}")
-                
-                logger.info(f"✅ Parsed JSON: {len(translated_json)} rows")
-                
-                # Validate row count
-                if len(translated_json) < len(json_data):
-                    logger.warning(f"⚠️ Row count mismatch! Input: {len(json_data)} rows, Output: {len(translated_json)} rows")
-                    logger.warning(f"Some content may have been truncated by GPT")
+            # Handle both array and object with array
+            if isinstance(translated_json, dict):
+                # Look for 'input_data' key first (our expected format)
+                if 'input_data' in translated_json and isinstance(translated_json['input_data'], list):
+                    translated_json = translated_json['input_data']
+                    logger.info("Extracted 'input_data' array from response")
                 else:
-                    logger.info(f"✅ Row count validated: {len(translated_json)} rows")
-                
-                logger.info(f"Translation completed, returning JSON data")
-                
-                return translated_json
-                
-            except json.JSONDecodeError as e:
-                logger.error(f"Failed to parse JSON response: {str(e)}")
-                logger.error(f"Response content: {translated_content[:1000]}...")
-                raise GPTAPIError(f"Invalid JSON response from GPT: {str(e)}")
+                    # Fallback: find any list in the response
+                    for key in translated_json:
+                        if isinstance(translated_json[key], list) and key != 'rules':
+                            translated_json = translated_json[key]
+                            logger.info(f"Extracted '{key}' array from response")
+                            break
             
-        except Exception as e:
-            raise GPTAPIError(f"GPT API call failed: {str(e)}")
+            # Ensure it's a list
+            if not isinstance(translated_json, list):
+                raise GPTAPIError(f"Expected JSON array, got {type(translated_json)}")
+            
+            logger.info(f"✅ Parsed JSON: {len(translated_json)} rows")
+            
+            # Validate row count
+            if len(translated_json) < len(json_data):
+                logger.warning(f"⚠️ Row count mismatch! Input: {len(json_data)} rows, Output: {len(translated_json)} rows")
+                logger.warning(f"Some content may have been truncated by GPT")
+            else:
+                logger.info(f"✅ Row count validated: {len(translated_json)} rows")
+            
+            logger.info(f"Translation completed, returning JSON data")
+            
+            return translated_json
+            
+        except orjson.JSONDecodeError as e:
+            logger.error(f"Failed to parse JSON response: {str(e)}")
+            logger.error(f"Response content: {translated_content[:1000]}...")
+            raise GPTAPIError(f"Invalid JSON response from GPT: {str(e)}")
     
     def _translate_in_chunks(
         self,
@@ -225,9 +733,11 @@ class TranslationService:
         source_lang: str,
         target_lang: str,
         chunk_size: int
-    ) -> str:
+    ) -> List[Dict]:
         """
-        Translate large dataset by splitting into chunks
+        Translate large dataset by splitting into fixed-size chunks
+        
+        Synchronous wrapper around _translate_in_chunks_async.
         
         Args:
             json_data: List of dictionaries representing CSV rows
@@ -236,45 +746,86 @@ class TranslationService:
             chunk_size: Number of rows per chunk
             
         Returns:
-            Translated CSV string (all chunks combined)
+            Translated JSON data (all chunks combined)
+        """
+        chunks = [json_data[i:i + chunk_size] for i in range(0, len(json_data), chunk_size)]
+        return self._run_sync(self._translate_in_chunks_async(chunks, source_lang, target_lang, True))
+    
+    async def _translate_in_chunks_async(
+        self,
+        chunks: List[List[Dict]],
+        source_lang: str,
+        target_lang: str,
+        report_progress: bool = False
+    ) -> List[Dict]:
+        """
+        Translate a large dataset, sending its chunks concurrently
+        
+        Args:
+            chunks: Row chunks, each one GPT request
+            source_lang: Source language code
+            target_lang: Target language code
+            report_progress: Report each chunk's rows to the progress callback
+            
+        Returns:
+            Translated JSON data (all chunks combined, in input order)
         """
-        translated_chunks = []
-        total_chunks = (len(json_data) + chunk_size - 1) // chunk_size
+        total_chunks = len(chunks)
         
-        logger.info(f"Splitting {len(json_data)} rows into {total_chunks} chunks of {chunk_size} rows each")
+        logger.info(f"Translating {sum(len(chunk) for chunk in chunks)} rows in {total_chunks} chunks")
         
-        # Notify about total chunks if callback exists
-        if self.progress_callback:
-            self.progress_callback('chunks_total', total_chunks)
+        # Chunks are independent requests, so send them concurrently (bounded)
+        semaphore = asyncio.Semaphore(settings.CHUNK_CONCURRENCY)
         
-        for i in range(0, len(json_data), chunk_size):
-            chunk = json_data[i:i + chunk_size]
-            chunk_num = (i // chunk_size) + 1
-            
-            logger.info(f"📦 청크 {chunk_num}/{total_chunks} 번역 시작 ({len(chunk)} rows)")
-            
-            try:
-                # Translate this chunk (returns JSON directly)
-                chunk_json = self._translate_json_data(chunk, source_lang, target_lang)
-                translated_chunks.extend(chunk_json)
+        async def translate_chunk(chunk_num: int, chunk: List[Dict]) -> List[Dict]:
+            async with semaphore:
+                logger.info(f"📦 청크 {chunk_num}/{total_chunks} 번역 시작 ({len(chunk)} rows)")
+                
+                try:
+                    # Translate this chunk (returns JSON directly)
+                    chunk_json = await self._translate_json_data_async(chunk, source_lang, target_lang)
+                except Exception as e:
+                    logger.error(f"❌ Chunk {chunk_num}/{total_chunks} failed: {str(e)}")
+                    raise GPTAPIError(f"Failed to translate chunk {chunk_num}: {str(e)}")
                 
                 logger.info(f"✅ 청크 {chunk_num}/{total_chunks} 번역 완료 ({len(chunk_json)} rows)")
                 
-                # Notify progress if callback exists
-                if self.progress_callback:
-                    self.progress_callback('chunk_complete', chunk_num, total_chunks)
+                # Progress is counted in rows, whose total is known up front
+                if report_progress:
+                    self._report_rows(len(chunk))
                 
-            except Exception as e:
-                logger.error(f"❌ Chunk {chunk_num}/{total_chunks} failed: {str(e)}")
-                raise GPTAPIError(f"Failed to translate chunk {chunk_num}: {str(e)}")
+                return chunk_json
+        
+        tasks = [
+            asyncio.create_task(translate_chunk(chunk_num, chunk))
+            for chunk_num, chunk in enumerate(chunks, 1)
+        ]
+        
+        try:
+            results = await asyncio.gather(*tasks)
+        except Exception:
+            # Stop the remaining requests once one chunk has failed
+            for task in tasks:
+                task.cancel()
+            raise
         
         # Combine all chunks
+        translated_chunks = [row for chunk_json in results for row in chunk_json]
         logger.info(f"✅ All chunks translated. Combining {len(translated_chunks)} total rows")
         
-        # Convert combined JSON back to CSV
-        final_csv = self._json_to_csv(translated_chunks)
+        return translated_chunks
+    
+    @staticmethod
+    def _run_sync(coro):
+        """Run a coroutine to completion on a private event loop"""
+        async def runner():
+            try:
+                return await coro
+            finally:
+                # Connections opened on this loop cannot be reused once it closes
+                await close_async_clients()
         
-        return final_csv
+        return asyncio.run(runner())
     
     def _calculate_cost(self, model: str, prompt_tokens: int, completion_tokens: int) -> float:
         """
@@ -321,28 +872,13 @@ class TranslationService:
             Cleaned CSV content
         """
         # Remove markdown code blocks
-        content = re.sub(r'```csv\n', '', content)
-        content = re.sub(r'```\n', '', content)
-        content = re.sub(r'```', '', content)
+        content = _MARKDOWN_FENCE_RE.sub('', content)
         
         # Remove sheet name lines that GPT sometimes adds
         # Pattern: (Sheet name: xxx) or similar variations
-        lines = content.split('\n')
-        cleaned_lines = []
-        
-        for i, line in enumerate(lines):
-            # Skip lines that look like sheet name annotations
-            if line.strip().startswith('(Sheet name:') or line.strip().startswith('(시트 이름:'):
-                logger.info(f"Removing sheet name annotation: {line.strip()}")
-                continue
-            
-            # Skip empty lines at the beginning
-            if i == 0 and not line.strip():
-                continue
-                
-            cleaned_lines.append(line)
-        
-        content = '\n'.join(cleaned_lines)
+        content, removed = _SHEET_ANNOTATION_RE.subn('', content)
+        if removed:
+            logger.info(f"Removed {removed} sheet name annotation(s)")
         
         return content.strip()
     
@@ -355,6 +891,8 @@ class TranslationService:
         """
         Translate multiple sheets
         
+        Synchronous wrapper around translate_multiple_sheets_async.
+        
         Args:
             csv_dict: Dict with sheet names as keys and CSV strings as values
             source_lang: Source language code
@@ -363,17 +901,46 @@ class TranslationService:
         Returns:
             Dict with sheet names as keys and translated CSV strings as values
         """
-        translated_dict = {}
+        return self._run_sync(self.translate_multiple_sheets_async(csv_dict, source_lang, target_lang))
+    
+    async def translate_multiple_sheets_async(
+        self,
+        csv_dict: Dict[str, str],
+        source_lang: str,
+        target_lang: str
+    ) -> Dict[str, str]:
+        """
+        Translate multiple sheets concurrently
         
-        for sheet_name, csv_content in csv_dict.items():
-            translated_content = self.translate_csv(
-                csv_content,
-                source_lang,
-                target_lang,
-                sheet_name
-            )
-            translated_dict[sheet_name] = translated_content
+        Sheets are independent, so they are translated at the same time
+        (at most TRANSLATE_CONCURRENCY at once) and wall time tracks the
+        slowest sheet rather than the sum of all sheets.
         
-        return translated_dict
+        Args:
+            csv_dict: Dict with sheet names as keys and CSV strings as values
+            source_lang: Source language code
+            target_lang: Target language code
+            
+        Returns:
+            Dict with sheet names as keys and translated CSV strings as values
+        """
+        semaphore = asyncio.Semaphore(settings.TRANSLATE_CONCURRENCY)
+        
+        async def translate_sheet(sheet_name: str, csv_content: str) -> str:
+            async with semaphore:
+                return await self.translate_csv_chunks_async(
+                    [csv_content],
+                    source_lang,
+                    target_lang,
+                    sheet_name
+                )
+        
+        results = await asyncio.gather(*(
+            translate_sheet(sheet_name, csv_content)
+            for sheet_name, csv_content in csv_dict.items()
+        ))
+        
+        # Keep the original sheet order
+        return dict(zip(csv_dict.keys(), results))
 
 # Made with Bob
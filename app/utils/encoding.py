@@ -1,21 +1,117 @@
 import chardet
+import codecs
+from functools import lru_cache
 from pathlib import Path
-from typing import Tuple
+from typing import Optional, Tuple
+
+# chardet is accurate well before this many bytes; reading whole files only
+# makes detection slower (and memory-hungry) on large uploads
+ENCODING_SAMPLE_SIZE = 256 * 1024
+
+# Read size when validating the rest of a file as UTF-8
+UTF8_SCAN_CHUNK_SIZE = 1 << 20
+
+# Tried in order when chardet's confidence is low
+FALLBACK_ENCODINGS = ['utf-8', 'euc-kr', 'cp949', 'utf-16']
 
 
 def detect_encoding(file_path: Path) -> Tuple[str, float]:
     """
     Detect file encoding using chardet
     
+    UTF-8 (with or without BOM) is recognised by a strict decode without
+    calling chardet. A sample that is pure ASCII proves nothing about the
+    rest of the file, so in that case the remainder is validated as UTF-8
+    and, failing that, detection runs on the whole file. Otherwise
+    detection runs on the first ENCODING_SAMPLE_SIZE bytes and only falls
+    back to the whole file if the sample is inconclusive. Results are cached per (path, mtime, size),
+    so re-opening an unchanged file skips detection entirely.
+    
     Args:
         file_path: Path to the file
         
     Returns:
         Tuple of (encoding, confidence)
     """
+    stat = Path(file_path).stat()
+    return _detect_encoding_cached(str(file_path), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=128)
+def _detect_encoding_cached(file_path: str, mtime_ns: int, size: int) -> Tuple[str, float]:
+    """Detect encoding for a specific version of a file (cache key includes mtime/size)"""
     with open(file_path, 'rb') as f:
-        raw_data = f.read()
+        raw_data = f.read(ENCODING_SAMPLE_SIZE)
+    
+    is_complete = size <= len(raw_data)
+    
+    # Fast path: most uploads (and every CSV we write) are UTF-8, which
+    # a strict decode confirms far faster than chardet's statistical model
+    if raw_data.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig', 1.0
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    try:
+        decoder.decode(raw_data, final=is_complete)
+    except UnicodeDecodeError:
+        pass
+    else:
+        # Non-ASCII text that decodes as UTF-8 is UTF-8; an ASCII-only prefix
+        # (IDs, numbers, an English header) could still be followed by cp949
+        if is_complete or not raw_data.isascii():
+            return 'utf-8', 1.0
+        if _rest_is_utf8(file_path, len(raw_data), decoder):
+            return 'utf-8', 1.0
+        
+        # Not UTF-8, and an ASCII sample gives chardet nothing to go on
+        with open(file_path, 'rb') as f:
+            raw_data = f.read()
+        is_complete = True
+    
+    encoding, confidence = _detect_from_bytes(raw_data, is_complete)
+    
+    if encoding is None and not is_complete:
+        # Sample was inconclusive, use the whole file
+        with open(file_path, 'rb') as f:
+            raw_data = f.read()
+        encoding, confidence = _detect_from_bytes(raw_data, True)
+    
+    return encoding, confidence
+
+
+def _rest_is_utf8(file_path: str, offset: int, decoder: codecs.IncrementalDecoder) -> bool:
+    """
+    Check that a file decodes as UTF-8 from offset to the end
     
+    Args:
+        file_path: Path to the file
+        offset: Number of bytes already fed to decoder
+        decoder: UTF-8 incremental decoder holding the state at offset
+        
+    Returns:
+        True if the rest of the file is valid UTF-8
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            f.seek(offset)
+            while chunk := f.read(UTF8_SCAN_CHUNK_SIZE):
+                decoder.decode(chunk)
+        decoder.decode(b'', final=True)
+        return True
+    except UnicodeDecodeError:
+        return False
+
+
+def _detect_from_bytes(raw_data: bytes, is_complete: bool) -> Tuple[Optional[str], float]:
+    """
+    Detect encoding of raw bytes
+    
+    Args:
+        raw_data: File content, or a prefix of it
+        is_complete: False if raw_data is a prefix (may end mid-character)
+        
+    Returns:
+        Tuple of (encoding, confidence); encoding is None if a prefix was inconclusive
+    """
     result = chardet.detect(raw_data)
     encoding = result['encoding']
     confidence = result['confidence']
@@ -23,12 +119,16 @@ def detect_encoding(file_path: Path) -> Tuple[str, float]:
     # Fallback encodings if confidence is low
     if confidence < 0.7:
         # Try common encodings
-        for enc in ['utf-8', 'euc-kr', 'cp949', 'utf-16']:
+        for enc in FALLBACK_ENCODINGS:
             try:
-                raw_data.decode(enc)
+                # Incremental decoding tolerates a character cut off at the end of a sample
+                codecs.getincrementaldecoder(enc)().decode(raw_data, final=is_complete)
                 return enc, 1.0
             except UnicodeDecodeError:
                 continue
+        
+        if not is_complete:
+            return None, confidence
     
     return encoding, confidence
 
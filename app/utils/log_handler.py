@@ -1,10 +1,75 @@
+import asyncio
 import logging
+import logging.handlers
+import multiprocessing.queues
 import queue
-from typing import Dict, Set
+import threading
+from collections import deque
+from typing import Deque, Dict, List, Optional, Set
 import uuid
+import orjson
+from app.core.config import settings
 
-# Global log queues for each session
-log_queues: Dict[str, queue.Queue] = {}
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# Maximum number of pending log entries per subscriber; the oldest is
+# dropped when full so a slow client never blocks the producer
+LOG_QUEUE_MAXSIZE = settings.LOG_QUEUE_MAXSIZE
+
+# SSE subscribers for each session, and the event loop that consumes them
+session_subscribers: Dict[str, List["LogSubscriber"]] = {}
+_session_loops: Dict[str, asyncio.AbstractEventLoop] = {}
+
+# Payloads published before any client subscribed to the session
+_pending_payloads: Dict[str, Deque[bytes]] = {}
+
+# Root logger only enqueues records; the listener thread formats and writes them
+_record_queue: queue.SimpleQueue = queue.SimpleQueue()
+_listener: Optional[logging.handlers.QueueListener] = None
+_listener_lock = threading.Lock()
+
+# Forwards records from process pool workers into _record_queue
+_worker_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class LogSubscriber:
+    """
+    Payload buffer for one SSE client
+    
+    Only touched from the event loop thread (payloads arrive via
+    call_soon_threadsafe), so a bounded deque plus an Event replaces
+    asyncio.Queue's per-item bookkeeping.
+    """
+    
+    def __init__(self):
+        self.payloads: Deque[bytes] = deque(maxlen=LOG_QUEUE_MAXSIZE)
+        self.ready = asyncio.Event()
+    
+    def push(self, payload: bytes):
+        """Buffer a payload, dropping the oldest one when full"""
+        self.payloads.append(payload)
+        self.ready.set()
+    
+    async def drain(self, timeout: float) -> bytes:
+        """
+        Wait for payloads and return everything buffered so far
+        
+        Args:
+            timeout: Seconds to wait when nothing is buffered
+            
+        Returns:
+            Concatenated SSE payloads, or b"" on timeout
+        """
+        if not self.payloads:
+            self.ready.clear()
+            try:
+                await asyncio.wait_for(self.ready.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                return b""
+        
+        batch = b"".join(self.payloads)
+        self.payloads.clear()
+        return batch
 
 
 class SSELogHandler(logging.Handler):
@@ -14,58 +79,211 @@ class SSELogHandler(logging.Handler):
         super().__init__()
         self.session_id = session_id
         
-        # Create queue for this session if it doesn't exist
-        if session_id not in log_queues:
-            log_queues[session_id] = queue.Queue()
+        # Register this session if it doesn't exist
+        if session_id not in session_subscribers:
+            _register_session(session_id)
     
     def emit(self, record):
-        """Emit a log record to the queue"""
+        """Encode a log record once and fan it out (called from the listener thread)"""
         try:
-            log_entry = self.format(record)
+            loop = _session_loops.get(self.session_id)
+            if loop is None:
+                return
             
-            # Add to queue if session exists
-            if self.session_id in log_queues:
-                log_queues[self.session_id].put({
-                    'level': record.levelname,
-                    'message': log_entry,
-                    'timestamp': record.created
-                })
+            payload = b"data: " + orjson.dumps({
+                'type': 'log',
+                'level': record.levelname,
+                'message': self.format(record),
+                'timestamp': record.created
+            }) + b"\n\n"
+            loop.call_soon_threadsafe(_dispatch, self.session_id, payload)
         except Exception:
             self.handleError(record)
 
 
+def publish(session_id: str, event: dict):
+    """Encode an event once and fan it out to the session's SSE clients (thread-safe)"""
+    loop = _session_loops.get(session_id)
+    if loop is None:
+        return
+    
+    payload = b"data: " + orjson.dumps(event) + b"\n\n"
+    loop.call_soon_threadsafe(_dispatch, session_id, payload)
+
+
+def _register_session(session_id: str):
+    """Register a session bound to the running event loop"""
+    session_subscribers[session_id] = []
+    _pending_payloads[session_id] = deque(maxlen=LOG_QUEUE_MAXSIZE)
+    _session_loops[session_id] = asyncio.get_running_loop()
+
+
+def _dispatch(session_id: str, payload: bytes):
+    """Deliver an encoded payload to every subscriber of a session"""
+    subscribers = session_subscribers.get(session_id)
+    if subscribers is None:
+        return
+    
+    if not subscribers:
+        _pending_payloads[session_id].append(payload)
+        return
+    
+    for subscriber in subscribers:
+        subscriber.push(payload)
+
+
+def setup_queue_logging(level: int = logging.INFO):
+    """Route root logger through a queue so log calls never block on I/O"""
+    global _listener
+    if _listener is not None:
+        return
+    
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    _listener = logging.handlers.QueueListener(
+        _record_queue,
+        stream_handler,
+        respect_handler_level=True
+    )
+    
+    root_logger = logging.getLogger()
+    root_logger.setLevel(level)
+    root_logger.addHandler(logging.handlers.QueueHandler(_record_queue))
+
+
+def start_worker_log_forwarding(mp_context) -> "multiprocessing.queues.Queue":
+    """
+    Create a queue that worker processes can log into
+    
+    Records arriving on it are forwarded into the main log queue, so they
+    reach the console and session SSE handlers like records logged here.
+    
+    Args:
+        mp_context: multiprocessing context the workers are started with
+        
+    Returns:
+        Queue to hand to init_worker_logging in each worker
+    """
+    global _worker_listener
+    log_queue = mp_context.Queue()
+    _worker_listener = logging.handlers.QueueListener(
+        log_queue,
+        logging.handlers.QueueHandler(_record_queue)
+    )
+    _worker_listener.start()
+    return log_queue
+
+
+def stop_worker_log_forwarding():
+    """Forward any remaining worker records and stop the forwarding thread"""
+    global _worker_listener
+    if _worker_listener is not None:
+        _worker_listener.stop()
+        _worker_listener = None
+
+
+def init_worker_logging(log_queue, level: int):
+    """Process pool initializer: send this process's log records to the parent"""
+    root_logger = logging.getLogger()
+    root_logger.handlers[:] = [logging.handlers.QueueHandler(log_queue)]
+    root_logger.setLevel(level)
+
+
+def start_log_listener():
+    """Start the background thread that drains the log queue"""
+    if _listener is not None:
+        _listener.start()
+
+
+def stop_log_listener():
+    """Flush pending records and stop the log listener thread"""
+    if _listener is not None:
+        _listener.stop()
+
+
 def create_session() -> str:
     """Create a new session ID"""
     session_id = str(uuid.uuid4())
-    log_queues[session_id] = queue.Queue()
+    _register_session(session_id)
     return session_id
 
 
-def get_log_queue(session_id: str):
-    """Get log queue for a session"""
-    return log_queues.get(session_id)
+def subscribe(session_id: str) -> Optional[LogSubscriber]:
+    """Attach a new SSE client to a session and return its payload buffer"""
+    subscribers = session_subscribers.get(session_id)
+    if subscribers is None:
+        return None
+    
+    subscriber = LogSubscriber()
+    pending = _pending_payloads[session_id]
+    if pending:
+        subscriber.payloads.extend(pending)
+        pending.clear()
+    
+    subscribers.append(subscriber)
+    return subscriber
+
+
+def unsubscribe(session_id: str, subscriber: LogSubscriber):
+    """Detach an SSE client, cleaning up the session after the last one leaves"""
+    subscribers = session_subscribers.get(session_id)
+    if subscribers is None:
+        return
+    
+    if subscriber in subscribers:
+        subscribers.remove(subscriber)
+    
+    if not subscribers:
+        cleanup_session(session_id)
 
 
 def cleanup_session(session_id: str):
     """Clean up session resources"""
-    if session_id in log_queues:
-        del log_queues[session_id]
+    session_subscribers.pop(session_id, None)
+    _pending_payloads.pop(session_id, None)
+    _session_loops.pop(session_id, None)
+    _detach_session_handlers(session_id)
+
+
+def _detach_session_handlers(session_id: str):
+    """Stop feeding records to handlers of a session that no longer exists"""
+    def is_session_handler(handler: logging.Handler) -> bool:
+        return isinstance(handler, SSELogHandler) and handler.session_id == session_id
+    
+    if _listener is None:
+        root_logger = logging.getLogger()
+        for handler in [h for h in root_logger.handlers if is_session_handler(h)]:
+            root_logger.removeHandler(handler)
+        return
+    
+    with _listener_lock:
+        _listener.handlers = tuple(h for h in _listener.handlers if not is_session_handler(h))
 
 
 def add_session_handler(session_id: str):
-    """Add SSE handler to root logger for this session"""
+    """Add SSE handler to the log listener for this session"""
     handler = SSELogHandler(session_id)
-    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    formatter = logging.Formatter(LOG_FORMAT)
     handler.setFormatter(formatter)
     
-    # Add to root logger
-    logging.getLogger().addHandler(handler)
+    # Register with the listener (falls back to root logger if not configured)
+    if _listener is None:
+        logging.getLogger().addHandler(handler)
+        return handler
+    
+    with _listener_lock:
+        _listener.handlers = _listener.handlers + (handler,)
     
     return handler
 
 
 def remove_session_handler(handler: logging.Handler):
-    """Remove handler from root logger"""
-    logging.getLogger().removeHandler(handler)
+    """Remove handler from the log listener"""
+    if _listener is None:
+        logging.getLogger().removeHandler(handler)
+        return
+    
+    with _listener_lock:
+        _listener.handlers = tuple(h for h in _listener.handlers if h is not handler)
 
 # Made with Bob
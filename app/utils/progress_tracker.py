@@ -1,9 +1,13 @@
 """
 Progress tracking utilities for translation process
 """
-from typing import Dict, Optional
+from typing import Deque, Dict, Optional
+from collections import OrderedDict, deque
+from contextlib import suppress
 from enum import Enum
 import logging
+import time
+from app.utils.log_handler import publish
 
 logger = logging.getLogger(__name__)
 
@@ -17,8 +21,18 @@ class TranslationStage(str, Enum):
     COMPLETE = "complete"
 
 
+# Plain string value of each stage, for building events without Enum lookups
+_STAGE_VALUES: Dict[TranslationStage, str] = {s: s.value for s in TranslationStage}
+
+
 class ProgressTracker:
-    """Track translation progress and calculate percentages"""
+    """Track translation progress and push progress events to the session's SSE stream"""
+    
+    __slots__ = (
+        "session_id", "current_stage", "total_chunks", "completed_chunks",
+        "_last_flush", "_last_key", "_last_progress", "_progress_result",
+        "_is_translation",
+    )
     
     # Stage weight distribution (total = 100%)
     STAGE_WEIGHTS = {
@@ -29,108 +43,193 @@ class ProgressTracker:
         TranslationStage.COMPLETE: 5,          # 95-100%
     }
     
+    # Start/end percentage of each stage, precomputed from the weights
+    STAGE_START: Dict[TranslationStage, int] = {}
+    STAGE_END: Dict[TranslationStage, int] = {}
+    _acc = 0
+    for _s in TranslationStage:
+        STAGE_START[_s] = _acc
+        _acc += STAGE_WEIGHTS[_s]
+        STAGE_END[_s] = _acc
+    del _acc, _s
+    # Stage -> start percentage; a builtin method, so it isn't bound to self
+    _stage_base = STAGE_START.__getitem__
+    _TRANSLATION_WEIGHT = STAGE_WEIGHTS[TranslationStage.TRANSLATION]
+    
+    # Minimum seconds between chunk progress events pushed to the client
+    PROGRESS_FLUSH_INTERVAL = 0.1
+    
     def __init__(self, session_id: str):
+        self.reset(session_id)
+    
+    def reset(self, session_id: str):
+        """Re-initialize the tracker for a new session (used by the tracker pool)"""
         self.session_id = session_id
         self.current_stage = TranslationStage.UPLOAD
+        self._is_translation = False
         self.total_chunks = 0
         self.completed_chunks = 0
-        
+        self._last_flush = 0.0
+        self._last_key = None
+        self._last_progress = 0
+        # Reused for every chunk event; publish() encodes it synchronously
+        self._progress_result = {
+            "type": "progress",
+            "stage": None,
+            "current": 0,
+            "total": 0,
+            "percentage": 0,
+            "message": ""
+        }
+    
     def get_stage_start_percentage(self, stage: TranslationStage) -> int:
         """Get the starting percentage for a given stage"""
-        start = 0
-        for s in TranslationStage:
-            if s == stage:
-                break
-            start += self.STAGE_WEIGHTS[s]
-        return start
+        return self._stage_base(stage)
     
     def calculate_progress(self) -> int:
         """Calculate current progress percentage"""
-        base_progress = self.get_stage_start_percentage(self.current_stage)
+        # Same stage and counts as last time: reuse the cached result
+        key = (self.current_stage, self.completed_chunks, self.total_chunks)
+        if key == self._last_key:
+            return self._last_progress
+        
+        base_progress = self._stage_base(self.current_stage)
         
-        if self.current_stage == TranslationStage.TRANSLATION and self.total_chunks > 0:
-            # Calculate translation progress based on chunks
-            chunk_progress = (self.completed_chunks / self.total_chunks) * self.STAGE_WEIGHTS[TranslationStage.TRANSLATION]
-            return int(base_progress + chunk_progress)
+        if self._is_translation and self.total_chunks > 0:
+            # Calculate translation progress based on chunks (integer math)
+            chunk_progress = (self.completed_chunks * self._TRANSLATION_WEIGHT) // self.total_chunks
+            progress = base_progress + chunk_progress
         else:
             # For other stages, return the start of the stage
-            return base_progress
+            progress = base_progress
+        
+        self._last_key = key
+        self._last_progress = progress
+        return progress
     
     def set_stage(self, stage: TranslationStage, message: Optional[str] = None):
         """Set current stage and log milestone"""
         self.current_stage = stage
+        self._is_translation = stage is TranslationStage.TRANSLATION
         progress = self.calculate_progress()
         
         if message:
-            logger.info(f"📍 MILESTONE: {message} ({progress}%)")
+            logger.info("📍 MILESTONE: %s (%d%%)", message, progress)
         
-        return {
+        event = {
             "type": "milestone",
-            "stage": stage.value,
+            "stage": _STAGE_VALUES[stage],
             "percentage": progress,
-            "message": message or f"Stage: {stage.value}"
+            "message": message or f"Stage: {_STAGE_VALUES[stage]}"
         }
+        publish(self.session_id, event)
+        return event
     
     def set_translation_chunks(self, total: int):
-        """Set total number of translation chunks"""
+        """Set total number of translation units (sheet rows) for this job"""
         self.total_chunks = total
         self.completed_chunks = 0
-        logger.info(f"📦 Translation will process {total} chunks")
+        logger.info("📦 Translation will process %d rows", total)
     
     def increment_chunk(self, current: int, total: int, message: Optional[str] = None):
-        """Increment completed chunks and calculate progress"""
+        """
+        Update completed translation units and calculate progress
+        
+        Returns the tracker's shared progress dict, updated in place; copy it
+        if it needs to outlive the next call.
+        """
         self.completed_chunks = current
         self.total_chunks = total
         progress = self.calculate_progress()
         
-        default_message = f"청크 {current}/{total} 번역 완료"
-        log_message = message or default_message
+        # Coalesce bursts of chunk completions into at most one event per interval
+        now = time.monotonic()
+        flush = current >= total or now - self._last_flush >= self.PROGRESS_FLUSH_INTERVAL
+        log_enabled = logger.isEnabledFor(logging.INFO)
         
-        logger.info(f"📦 PROGRESS: {log_message} ({progress}%)")
+        # Only build the default message when something will show it
+        log_message = message or ""
+        if not message and (flush or log_enabled):
+            log_message = f"{current}/{total} 행 번역 완료"
         
-        return {
-            "type": "progress",
-            "stage": self.current_stage.value,
-            "current": current,
-            "total": total,
-            "percentage": progress,
-            "message": log_message
-        }
+        if log_enabled:
+            logger.info("📦 PROGRESS: %s (%d%%)", log_message, progress)
+        
+        event = self._progress_result
+        event["stage"] = _STAGE_VALUES[self.current_stage]
+        event["current"] = current
+        event["total"] = total
+        event["percentage"] = progress
+        event["message"] = log_message
+        
+        if flush:
+            self._last_flush = now
+            publish(self.session_id, event)
+        return event
     
     def complete_stage(self, stage: TranslationStage, message: Optional[str] = None):
         """Mark a stage as complete and move to next"""
         # Calculate progress at the end of this stage
-        base = self.get_stage_start_percentage(stage)
-        progress = base + self.STAGE_WEIGHTS[stage]
+        progress = self.STAGE_END[stage]
         
         if message:
-            logger.info(f"✅ COMPLETE: {message} ({progress}%)")
+            logger.info("✅ COMPLETE: %s (%d%%)", message, progress)
         
-        return {
+        event = {
             "type": "milestone",
-            "stage": stage.value,
+            "stage": _STAGE_VALUES[stage],
             "percentage": progress,
-            "message": message or f"Completed: {stage.value}",
+            "message": message or f"Completed: {_STAGE_VALUES[stage]}",
             "completed": True
         }
+        publish(self.session_id, event)
+        return event
+
+
+# Global progress trackers, least recently used first
+_MAX_TRACKERS = 10_000
+_progress_trackers: "OrderedDict[str, ProgressTracker]" = OrderedDict()
+
+# Trackers of finished sessions, reset and reused instead of reallocated
+_TRACKER_POOL_SIZE = 256
+_tracker_pool: Deque[ProgressTracker] = deque(maxlen=_TRACKER_POOL_SIZE)
 
 
-# Global progress trackers
-_progress_trackers: Dict[str, ProgressTracker] = {}
+def _new_tracker(session_id: str) -> ProgressTracker:
+    """Take a tracker from the pool, or allocate one if the pool is empty"""
+    try:
+        tracker = _tracker_pool.pop()
+    except IndexError:
+        return ProgressTracker(session_id)
+    tracker.reset(session_id)
+    return tracker
 
 
 def get_progress_tracker(session_id: str) -> ProgressTracker:
     """Get or create progress tracker for session"""
-    if session_id not in _progress_trackers:
-        _progress_trackers[session_id] = ProgressTracker(session_id)
-    return _progress_trackers[session_id]
+    tracker = _progress_trackers.get(session_id)
+    if tracker is None:
+        # setdefault is atomic: concurrent callers all get the same tracker
+        candidate = _new_tracker(session_id)
+        tracker = _progress_trackers.setdefault(session_id, candidate)
+        if tracker is not candidate:
+            _tracker_pool.append(candidate)
+        # Bound the registry if sessions were never cleaned up
+        while len(_progress_trackers) > _MAX_TRACKERS:
+            evicted_id, _ = _progress_trackers.popitem(last=False)
+            logger.warning("Evicted stale progress tracker for session %s", evicted_id)
+    else:
+        with suppress(KeyError):
+            _progress_trackers.move_to_end(session_id)
+    return tracker
 
 
 def cleanup_progress_tracker(session_id: str):
     """Remove progress tracker for session"""
-    if session_id in _progress_trackers:
-        del _progress_trackers[session_id]
-        logger.debug(f"Cleaned up progress tracker for session {session_id}")
+    tracker = _progress_trackers.pop(session_id, None)
+    if tracker is not None:
+        _tracker_pool.append(tracker)
+        logger.debug("Cleaned up progress tracker for session %s", session_id)
 
 
 # Made with Bob
@@ -1,7 +1,18 @@
-from pathlib import Path
 from app.core.config import settings
 from app.core.exceptions import InvalidFileFormatError
 
+# Settings are immutable, so resolve the limits once at import
+_ALLOWED_EXTS = frozenset(ext.lower() for ext in settings.ALLOWED_EXTENSIONS)
+_MAX_FILE_SIZE = settings.MAX_FILE_SIZE
+_ALLOWED_EXTS_MSG = repr(sorted(_ALLOWED_EXTS))
+
+
+def get_file_extension(filename: str) -> str:
+    """Lower-cased last ".ext" of filename, or "" (".csv" alone has no suffix, as with Path)"""
+    # rpartition avoids building a Path for every upload
+    head, sep, tail = filename.rpartition('.')
+    return ('.' + tail.lower()) if sep and head and tail else ''
+
 
 def validate_file_extension(filename: str) -> bool:
     """
@@ -16,10 +27,10 @@ def validate_file_extension(filename: str) -> bool:
     Raises:
         InvalidFileFormatError: If extension not supported
     """
-    ext = Path(filename).suffix.lower()
-    if ext not in settings.ALLOWED_EXTENSIONS:
+    ext = get_file_extension(filename)
+    if ext not in _ALLOWED_EXTS:
         raise InvalidFileFormatError(
-            f"File extension {ext} not supported. Allowed: {settings.ALLOWED_EXTENSIONS}"
+            f"File extension {ext} not supported. Allowed: {_ALLOWED_EXTS_MSG}"
         )
     return True
 
@@ -37,9 +48,9 @@ def validate_file_size(file_size: int) -> bool:
     Raises:
         InvalidFileFormatError: If file too large
     """
-    if file_size > settings.MAX_FILE_SIZE:
+    if file_size > _MAX_FILE_SIZE:
         raise InvalidFileFormatError(
-            f"File size {file_size} exceeds maximum {settings.MAX_FILE_SIZE}"
+            f"File size {file_size} exceeds maximum {_MAX_FILE_SIZE}"
         )
     return True
 
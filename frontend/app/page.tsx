@@ -79,6 +79,13 @@ export default function Home() {
     eventSource.onmessage = (event) => {
       try {
         const data = JSON.parse(event.data);
+
+        // Progress events share the log stream and carry the percentage directly
+        if (data.type === "progress" || data.type === "milestone") {
+          setProgress(data.percentage);
+          return;
+        }
+
         const message = data.message || data.log;
 
         if (message) {
@@ -92,14 +99,6 @@ export default function Home() {
             return;
           }
 
-          // Check for milestones to update progress bar
-          if (message.includes("📍 MILESTONE") || message.includes("📦 PROGRESS") || message.includes("✅ COMPLETE")) {
-            const percentMatch = message.match(/\((\d+)%\)/);
-            if (percentMatch) {
-              setProgress(parseInt(percentMatch[1]));
-            }
-          }
-
           // Force UI update for every log
           setLogs((prev) => [...prev, message]);
         }
@@ -30,6 +30,14 @@ echo "📝 Press Ctrl+C to stop the server"
 echo ""
 
 # Start the server
-uvicorn app.main:app --reload --host 0.0.0.0 --port 8000
+# Log sessions and the job queue live in process memory, so an SSE stream and
+# its /api/translate request must reach the same worker. Only raise WORKERS
+# behind a proxy with session affinity.
+WORKERS=${WORKERS:-1}
+if [ "$WORKERS" -gt 1 ]; then
+    uvicorn app.main:app --host 0.0.0.0 --port 8000 --workers "$WORKERS"
+else
+    uvicorn app.main:app --reload --host 0.0.0.0 --port 8000
+fi
 
 # Made with Bob
@@ -42,6 +42,15 @@ async function connectSSE(sessionId) {
     eventSource.onmessage = (event) => {
         try {
             const data = JSON.parse(event.data);
+            
+            // Progress events share the log stream
+            if (data.type === 'progress' || data.type === 'milestone') {
+                const progressBar = document.querySelector('#progressContainer .progress-bar');
+                progressBar.style.width = `${data.percentage}%`;
+                progressBar.textContent = `${data.percentage}%`;
+                return;
+            }
+            
             addLog(data.level, data.message);
         } catch (e) {
             // Ignore keepalive messages
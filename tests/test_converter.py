@@ -0,0 +1,60 @@
+import re
+import tempfile
+import zipfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+
+from openpyxl import Workbook
+
+from app.services.converter import ExcelConverter
+
+
+class ExcelToCsvDictTest(unittest.TestCase):
+    def convert(self, rows):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "in.xlsx"
+            wb = Workbook()
+            for row in rows:
+                wb.active.append(row)
+            wb.save(path)
+            return ExcelConverter.excel_to_csv_dict(path)["Sheet"]
+
+    def test_date_only_column_written_as_dates(self):
+        csv_content = self.convert([
+            ["date", "stamp"],
+            [datetime(2024, 1, 1), datetime(2024, 1, 1, 9, 30)],
+            [None, datetime(2024, 1, 2)],
+        ])
+        self.assertEqual(
+            csv_content,
+            "date,stamp\n2024-01-01,2024-01-01 09:30:00\n,2024-01-02 00:00:00\n"
+        )
+
+    def test_mixed_column_keeps_datetimes(self):
+        csv_content = self.convert([["when"], [datetime(2024, 1, 1)], ["later"]])
+        self.assertEqual(csv_content, "when\n2024-01-01 00:00:00\nlater\n")
+
+    def test_stale_dimension_tag(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "in.xlsx"
+            wb = Workbook()
+            for row in [["a", "b"], ["1", "2"], ["3", "4"]]:
+                wb.active.append(row)
+            wb.save(path)
+
+            # Rewrite the sheet's <dimension ref> as "A1", as some writers leave it
+            rewritten = Path(tmp) / "stale.xlsx"
+            with zipfile.ZipFile(path) as src, zipfile.ZipFile(rewritten, "w") as dst:
+                for item in src.infolist():
+                    data = src.read(item.filename)
+                    if item.filename == "xl/worksheets/sheet1.xml":
+                        data = re.sub(rb'<dimension ref="[^"]*"', b'<dimension ref="A1"', data)
+                    dst.writestr(item, data)
+
+            csv_content = ExcelConverter.excel_to_csv_dict(rewritten)["Sheet"]
+        self.assertEqual(csv_content, "a,b\n1,2\n3,4\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
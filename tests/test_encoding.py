@@ -0,0 +1,43 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from app.utils.encoding import ENCODING_SAMPLE_SIZE, detect_encoding
+
+
+class DetectEncodingTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def write(self, name, data):
+        path = Path(self.tmp.name) / name
+        path.write_bytes(data)
+        return path
+
+    def ascii_prefix(self):
+        rows = []
+        size = 0
+        while size <= ENCODING_SAMPLE_SIZE:
+            row = f"{len(rows)},item{len(rows)}\n"
+            rows.append(row)
+            size += len(row)
+        return "id,name\n" + "".join(rows)
+
+    def test_cp949_after_ascii_sample(self):
+        text = self.ascii_prefix() + "".join(
+            f"{i},{name}\n"
+            for i, name in enumerate(["홍길동", "김철수", "서울특별시", "번역 완료", "가나다라"] * 10)
+        )
+        path = self.write("cp949.csv", text.encode("cp949"))
+        encoding, _ = detect_encoding(path)
+        self.assertEqual(path.read_bytes().decode(encoding), text)
+
+    def test_utf8_after_ascii_sample(self):
+        text = self.ascii_prefix() + "99,홍길동\n"
+        path = self.write("utf8.csv", text.encode("utf-8"))
+        self.assertEqual(detect_encoding(path), ("utf-8", 1.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
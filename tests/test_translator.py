@@ -0,0 +1,38 @@
+import csv
+import unittest
+from io import StringIO
+
+from app.services.translator import TranslationService, pacsv
+
+
+class CsvToJsonTest(unittest.TestCase):
+    def setUp(self):
+        self.service = TranslationService(api_key="test-key")
+
+    def assertMatchesDictReader(self, csv_content):
+        expected = list(csv.DictReader(StringIO(csv_content)))
+        self.assertEqual(self.service._csv_to_json(csv_content), expected)
+
+    def test_plain_rows(self):
+        self.assertMatchesDictReader("a,b\n1,2\n3,\n")
+
+    def test_quoted_newline_in_values(self):
+        self.assertMatchesDictReader('a,b\n"x\ny","q""z"\n')
+
+    def test_quoted_newline_in_header(self):
+        self.assertMatchesDictReader('"금액\n(원)",이름\n1000,홍길동\n2000,김철수\n')
+
+    def test_ragged_rows(self):
+        self.assertMatchesDictReader("a,b\n1,2,3\n4\n")
+
+    def test_bom_header(self):
+        self.assertMatchesDictReader("﻿a,b\n1,2\n")
+
+    @unittest.skipIf(pacsv is None, "pyarrow not installed")
+    def test_arrow_parses_quoted_newline_in_header(self):
+        rows = self.service._csv_to_json_arrow('"금액\n(원)",이름\n1000,홍길동\n')
+        self.assertEqual(rows, [{"금액\n(원)": "1000", "이름": "홍길동"}])
+
+
+if __name__ == "__main__":
+    unittest.main()